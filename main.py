@@ -1,92 +1,295 @@
 import wx
 import wx.adv
 import sqlite3
+import calendar
 from datetime import datetime, timedelta
 import threading
 import time
 import webbrowser
-import queue
+
+# Длительность единиц интервала повторения в секундах; месяцы считаются
+# отдельно по календарю в update_recurring_reminder
+_UNIT_SECONDS = {
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+    "weeks": 604800,
+}
+
+
+def _parse_sql_dt(s):
+    """Разбор строки формата "%Y-%m-%d %H:%M:%S" срезами.
+
+    Формат в БД фиксированный, поэтому вместо универсального strptime
+    достаточно пяти int() по известным позициям — на порядок быстрее.
+    Возвращает кортеж (год, месяц, день, час, минута).
+    """
+    return int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16])
+
+
+# Соответствие единиц интервала повторения между БД и интерфейсом;
+# константы модуля, чтобы диалог не собирал словари на каждый вызов
+_UNIT_RU = {
+    "minutes": "минуты",
+    "hours": "часы",
+    "days": "дни",
+    "weeks": "недели",
+    "months": "месяцы",
+}
+_UNIT_EN = {ru: en for en, ru in _UNIT_RU.items()}
+
+
+def _fmt_deadline(date, hour=0, minute=0):
+    """Сборка строки "%Y-%m-%d %H:%M:%S" из wx.DateTime и времени.
+
+    Обратная операция к _parse_sql_dt; общая для get_data всех диалогов.
+    """
+    month = date.GetMonth() + 1
+    return f"{date.GetYear()}-{month:02d}-{date.GetDay():02d} {hour:02d}:{minute:02d}:00"
+
+
+# Колонки списка в диалоге "Задачи проекта"
+_PROJECT_TASK_COLS = (("ID", 40), ("Заголовок", 200), ("Статус", 100),
+                      ("Срок", 100), ("Исполнитель", 150))
+
+
+def _setup_columns(ctrl, cols):
+    """Создание колонок списка по кортежу (заголовок, ширина)"""
+    for i, (name, width) in enumerate(cols):
+        ctrl.InsertColumn(i, name, width=width)
+
+# Иконка приложения декодируется с диска один раз на процесс
+_APP_ICON = None
+
+
+def _get_app_icon():
+    """Иконка приложения, закэшированная на уровне модуля"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        try:
+            _APP_ICON = wx.Icon("taskmanager.ico", wx.BITMAP_TYPE_ICO)
+        except Exception:
+            _APP_ICON = wx.NullIcon
+    return _APP_ICON
+
+
+class VirtualListCtrl(wx.ListCtrl):
+    """Виртуальный список (wx.LC_VIRTUAL).
+
+    Вместо InsertItem/SetItem на каждую строку данные хранятся как список
+    кортежей готовых строк, а wx запрашивает через OnGetItemText только
+    строки, видимые на экране. Перерисовка списка становится O(видимых
+    строк) вместо O(N). Просроченные строки подсвечиваются красным через
+    OnGetItemAttr.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL | wx.LC_VIRTUAL)
+        self._rows = []
+        self._overdue = set()
+        self._attr_overdue = wx.ItemAttr()
+        self._attr_overdue.SetTextColour(wx.RED)
+
+    def set_rows(self, rows, overdue=()):
+        """Замена всего содержимого списка одним вызовом"""
+        self._rows = rows
+        self._overdue = set(overdue)
+        self.SetItemCount(len(rows))
+        self.Refresh()
+
+    def update_cell(self, item, col, value, clear_overdue=False):
+        """Точечное обновление одной ячейки без перезагрузки списка"""
+        row = list(self._rows[item])
+        row[col] = value
+        self._rows[item] = tuple(row)
+        if clear_overdue:
+            self._overdue.discard(item)
+        self.RefreshItem(item)
+
+    def OnGetItemText(self, item, col):
+        return self._rows[item][col]
+
+    def OnGetItemAttr(self, item):
+        return self._attr_overdue if item in self._overdue else None
 
 
 class TaskManagerApp(wx.Frame):
+    # Колонки списков как данные: (заголовок, ширина).
+    # Каждый список строится одним циклом вместо серии InsertColumn
+    WORK_COLS = (("ID", 40), ("Заголовок", 150), ("Приоритет", 80), ("Статус", 100),
+                 ("Срок", 100), ("Проект", 120), ("Исполнитель", 120))
+    STUDY_COLS = (("ID", 40), ("Заголовок", 200), ("Курс", 150), ("Тема", 150),
+                  ("Приоритет", 80), ("Статус", 100), ("Срок", 100))
+    GOALS_COLS = (("ID", 40), ("Цель", 200), ("Категория", 120), ("Прогресс", 120),
+                  ("Приоритет", 80), ("Статус", 100), ("Срок", 100))
+    REMINDER_COLS = (("ID", 40), ("Сообщение", 300), ("Время напоминания", 150),
+                     ("Повторение", 100), ("Статус", 100))
+    EMPLOYEE_COLS = (("ID", 40), ("Имя", 150), ("Должность", 150), ("Email", 150),
+                     ("Телефон", 120))
+    PROJECT_COLS = (("ID", 40), ("Название", 200), ("Статус", 100), ("Начало", 100),
+                    ("Завершение", 100), ("Руководитель", 150))
+
     def __init__(self):
         super().__init__(parent=None, title='Менеджер задач', size=wx.Size(1000, 700))
 
-        # Очередь для межпоточного взаимодействия
-        self.reminder_queue = queue.Queue()
-        # queue (очередь) представляет собой структуру данных, которая работает по принципу "первым вошел, первым вышел"
-        # (FIFO - First In, First Out). Очередь позволяет добавлять элементы в конец очереди и извлекать элементы из
-        # начала очереди.
-        # Методы класса queue
-        # put(item): добавляет элемент item в конец очереди.
-        # get(): извлекает и возвращает элемент из начала очереди.
-        # empty(): возвращает True, если очередь пуста, и False в противном случае.
-
         # Инициализация базы данных в главном потоке
         self.init_db()  # вызов метода в этом же классе
 
+        # Кэш значений для фильтров-комбобоксов. Наполняется один раз
+        # при запуске и поддерживается обработчиками добавления/изменения
+        # /удаления, поэтому открытие вкладок не выполняет SELECT DISTINCT
+        self._projects = set(self._distinct("name", "projects"))
+        self._courses = set(self._distinct("course", "study_tasks"))
+        self._categories = set(self._distinct("category", "personal_goals"))
+
+        # Кэш пар (id, name) для комбобоксов диалога рабочих задач;
+        # заполняется лениво и сбрасывается CRUD-обработчиками
+        self._projects_cache = None
+        self._employees_cache = None
+
         # Создание интерфейса
         self.create_ui()
 
         # Загрузка данных
         self.load_data()
 
-        # Запуск потока напоминаний
+        # Запуск потока напоминаний. Условная переменная будит поток при
+        # изменении напоминаний, чтобы он не опрашивал БД по таймеру
         self.reminder_active = True
+        self._rem_cv = threading.Condition()
+        # Флаг "напоминания изменились": notify(), пришедший между
+        # запросом MIN(remind_time) и wait(), не должен потеряться
+        self._rem_dirty = False
         self.reminder_thread = threading.Thread(target=self.check_reminders, daemon=True)
         self.reminder_thread.start()
 
-        # Таймер для проверки очереди напоминаний
-        self.timer = wx.Timer(self)
-        self.Bind(wx.EVT_TIMER, self.process_reminder_queue, self.timer)
-        self.timer.Start(1000)  # Проверка каждую секунду
-
         # Bind close event to stop reminder thread
         self.Bind(wx.EVT_CLOSE, self.on_close)
 
         # Set application icon (optional)
-        try:
-            self.SetIcon(wx.Icon("taskmanager.ico"))
-        except:
-            pass
+        icon = _get_app_icon()
+        if icon.IsOk():
+            self.SetIcon(icon)
+
+    def _on_reminder_fired(self, reminder):
+        """Обработка сработавшего напоминания в главном потоке.
+
+        Вызывается из потока напоминаний через wx.CallAfter, поэтому
+        выполняется в GUI-потоке только когда напоминание действительно
+        сработало — без периодического опроса очереди по таймеру.
+        """
+        self.show_reminder(reminder)
+        if hasattr(self, 'reminders_list'):
+            self.load_reminders()
 
-    def process_reminder_queue(self, event):
-        """Обработка очереди напоминаний в главном потоке"""
-        try:
-            while not self.reminder_queue.empty():
-                reminder = self.reminder_queue.get_nowait()
-                self.show_reminder(reminder)
-                self.load_reminders()
-        except queue.Empty:
-            pass
+    def _connection(self):
+        """Соединение SQLite текущего потока.
+
+        Каждый поток (GUI и поток напоминаний) получает собственное
+        соединение через threading.local(), поэтому запросы разных потоков
+        не сериализуются на общем мьютексе одного соединения, как это было
+        с check_same_thread=False.
+        """
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            # isolation_level=None: модуль sqlite3 не открывает неявных
+            # транзакций, пакетные операции группируются явным
+            # BEGIN ... COMMIT и платят один fsync на весь пакет
+            # cached_statements: готовые программы VDBE переиспользуются
+            # между вызовами одного и того же SQL без повторного парсинга
+            # check_same_thread=False: соединение по-прежнему использует
+            # только создавший его поток, но GUI-поток передает свое
+            # соединение потоку завершения в on_close — уже после того,
+            # как сам перестал им пользоваться
+            conn = self._tls.conn = sqlite3.connect(
+                'taskmanager.db', isolation_level=None, cached_statements=512,
+                check_same_thread=False)
+            # Доступ к колонкам по имени: загрузчики не зависят от
+            # порядка колонок в SELECT
+            conn.row_factory = sqlite3.Row
+            # Настройка SQLite под интерактивное GUI-приложение:
+            # WAL позволяет читателям и писателю работать одновременно
+            # (GUI-поток не ждет поток напоминаний), synchronous=NORMAL
+            # убирает лишний fsync на каждый commit, остальные прагмы
+            # держат временные данные и горячие страницы в памяти.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-32768")
+            # 256 МБ mmap: чтения идут из отображенной памяти без
+            # pread() на каждую страницу
+            conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    def _cursor(self):
+        """Курсор соединения SQLite текущего потока"""
+        return self._connection().cursor()
+
+    def _distinct(self, col, table):
+        """Уникальные непустые значения колонки одним запросом"""
+        cur = self._cursor()
+        return [r[0] for r in cur.execute(
+            f"SELECT DISTINCT {col} FROM {table} WHERE {col} IS NOT NULL")]
+
+    def _add_filter_value(self, cache, value, combo_attr):
+        """Добавить новое значение в кэш фильтра и обновить ComboBox"""
+        if value and value not in cache:
+            cache.add(value)
+            combo = getattr(self, combo_attr, None)
+            if combo is not None:
+                # Set() очищает и текст комбобокса — выбранный фильтр
+                # восстанавливается после перезаполнения
+                current = combo.GetValue()
+                combo.Set(["Все"] + sorted(cache))
+                combo.SetValue(current if current else "Все")
+
+    def get_projects_cached(self):
+        """Пары (id, name) проектов для комбобоксов диалогов.
+
+        Мемоизируются в атрибуте, чтобы каждое открытие диалога не
+        перечитывало таблицу; кэш сбрасывают обработчики CRUD проектов.
+        """
+        if self._projects_cache is None:
+            cur = self._cursor()
+            cur.execute("SELECT id, name FROM projects")
+            self._projects_cache = cur.fetchall()
+        return self._projects_cache
+
+    def get_employees_cached(self):
+        """Пары (id, name) сотрудников, аналогично get_projects_cached"""
+        if self._employees_cache is None:
+            cur = self._cursor()
+            cur.execute("SELECT id, name FROM employees")
+            self._employees_cache = cur.fetchall()
+        return self._employees_cache
+
+    def _reload_filter_values(self, cache_attr, col, table, combo_attr):
+        """Пересобрать кэш фильтра после удаления строк"""
+        cache = set(self._distinct(col, table))
+        setattr(self, cache_attr, cache)
+        combo = getattr(self, combo_attr, None)
+        if combo is not None:
+            # Выбранный фильтр переживает перезаполнение, как в
+            # _add_filter_value
+            current = combo.GetValue()
+            combo.Set(["Все"] + sorted(cache))
+            combo.SetValue(current if current else "Все")
 
     def init_db(self):
         """Инициализация базы данных и создание таблиц"""
-        self.conn = sqlite3.connect('taskmanager.db', check_same_thread=False)
-        # Эта строка кода создает подключение к SQLite базе данных с важной настройкой для многопоточности.
-        # 1. Основные компоненты:
-        # sqlite3.connect() - функция для подключения к SQLite базе
-        # 'taskmanager.db' - имя файла базы данных
-        # check_same_thread=False - критически важный параметр для многопоточности
-        # 2. Что делает параметр check_same_thread=False:
-        # Обычное поведение (без параметра): SQLite блокирует использование подключения из других потоков
-        # С этим параметром: разрешает использование подключения из разных потоков
-        # 3. Почему это важно в вашем приложении:
-        # Главный поток: работает с GUI (wxPython)
-        # Фоновый поток: проверяет напоминания
-        # Оба потока должны иметь доступ к БД
-
-        self.cursor = self.conn.cursor()
-        # Эта строка кода создает курсор базы данных - важнейший инструмент для выполнения операций с SQLite.
-        # 1. Что такое курсор?
-        # Курсор - это объект-посредник, который:
-        # Выполняет SQL-запросы (SELECT, INSERT, UPDATE и т.д.)
-        # Хранит результаты запросов.
-        # Позволяет перемещаться по полученным данным
-        # Аналогия: представьте курсор как компьютерную мышь для работы с базой данных)
+        # Хранилище соединений по потокам; само соединение создается
+        # лениво при первом обращении потока к _connection()
+        self._tls = threading.local()
+
+        # Схема создается один раз в главном потоке, до запуска потока
+        # напоминаний, поэтому гонки при CREATE TABLE исключены.
+        # Вся DDL-последовательность идет одной транзакцией — один fsync
+        # вместо fsync на каждый CREATE
+        cur = self._cursor()
+        cur.execute("BEGIN")
 
         # Создание таблиц, если они не существуют
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS work_tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -115,7 +318,7 @@ class TaskManagerApp(wx.Frame):
         # assigned_to - идентификатор назначенного сотрудника (исполнитель)
         # category TEXT - произвольная категория для группировки задач
 
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS study_tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -130,7 +333,7 @@ class TaskManagerApp(wx.Frame):
             )
         ''')
 
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS personal_goals (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -145,7 +348,7 @@ class TaskManagerApp(wx.Frame):
             )
         ''')
 
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS employees (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -156,7 +359,7 @@ class TaskManagerApp(wx.Frame):
             )
         ''')
 
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -168,7 +371,7 @@ class TaskManagerApp(wx.Frame):
             )
         ''')
 
-        self.cursor.execute('''
+        cur.execute('''
             CREATE TABLE IF NOT EXISTS reminders (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 message TEXT NOT NULL,
@@ -181,33 +384,65 @@ class TaskManagerApp(wx.Frame):
             )
         ''')
 
-        self.conn.commit()
+        # Индексы под фильтры и сортировку загрузчиков: без них каждый
+        # load_* и ежеминутный скан напоминаний — полный проход по таблице
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_work_status_project_dl
+                       ON work_tasks(status, project, deadline, priority)''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_study_course_status_dl
+                       ON study_tasks(course, status, deadline, priority)''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_goals_cat_status
+                       ON personal_goals(category, status, deadline, priority)''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_rem_pending
+                       ON reminders(is_completed, remind_time)''')
+        # Сортировка без фильтра ("Все"/"Все") идет по этим индексам
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_work_tasks_order
+                       ON work_tasks(deadline, priority)''')
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_goals_order
+                       ON personal_goals(deadline, priority)''')
+        # Проверка занятости сотрудника в on_delete_employee
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_work_tasks_assigned
+                       ON work_tasks(assigned_to)''')
+        # Диалог "Задачи проекта" читает прямо в порядке индекса
+        cur.execute('''CREATE INDEX IF NOT EXISTS idx_work_tasks_project_deadline
+                       ON work_tasks(project, deadline)''')
+
+        cur.execute("COMMIT")
 
     def create_ui(self):
         """Создание пользовательского интерфейса"""
         # Создание вкладок
         self.notebook = wx.Notebook(self)
 
-        # Вкладка "Работа"
+        # Вкладка "Работа" — единственная, которую пользователь видит
+        # при запуске, поэтому только она строится сразу
         self.work_tab = wx.Panel(self.notebook)
         self.create_work_tab()
         self.notebook.AddPage(self.work_tab, "Работа")
 
+        # Остальные вкладки добавляются пустыми панелями: их виджеты и
+        # запросы к БД откладываются до первого переключения на вкладку,
+        # так что запуск оплачивает только вкладку по умолчанию
+
         # Вкладка "Учеба"
         self.study_tab = wx.Panel(self.notebook)
-        self.create_study_tab()
         self.notebook.AddPage(self.study_tab, "Учеба")
 
         # Вкладка "Цели"
         self.goals_tab = wx.Panel(self.notebook)
-        self.create_goals_tab()
         self.notebook.AddPage(self.goals_tab, "Цели")
 
         # Вкладка "Напоминания"
         self.reminders_tab = wx.Panel(self.notebook)
-        self.create_reminders_tab()
         self.notebook.AddPage(self.reminders_tab, "Напоминания")
 
+        # Строители ленивых вкладок: (построение интерфейса, загрузка данных)
+        self._tab_builders = {
+            1: (self.create_study_tab, self.load_study_tasks),
+            2: (self.create_goals_tab, self.load_goals),
+            3: (self.create_reminders_tab, self.load_reminders),
+        }
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_tab_changed)
+
         # Строка состояния
         self.status_bar = self.CreateStatusBar(2)
         self.status_bar.SetStatusWidths([-2, -1])
@@ -221,6 +456,21 @@ class TaskManagerApp(wx.Frame):
         # Меню
         self.create_menu_bar()
 
+    def on_tab_changed(self, event):
+        """Ленивое построение вкладки при первом открытии"""
+        self._ensure_tab_built(event.GetSelection())
+        event.Skip()
+
+    def _ensure_tab_built(self, page):
+        """Построение и загрузка вкладки, если она еще не строилась"""
+        builder = self._tab_builders.pop(page, None)
+        if builder is not None:
+            create_tab, load_tab = builder
+            create_tab()
+            self.notebook.GetPage(page).Layout()
+            load_tab()
+            self.update_stats()
+
     def create_menu_bar(self):
         """Создание меню приложения"""
         menu_bar = wx.MenuBar()
@@ -253,14 +503,8 @@ class TaskManagerApp(wx.Frame):
         panel = self.work_tab
 
         # Основные элементы
-        self.work_task_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.work_task_list.InsertColumn(0, "ID", width=40)
-        self.work_task_list.InsertColumn(1, "Заголовок", width=150)
-        self.work_task_list.InsertColumn(2, "Приоритет", width=80)
-        self.work_task_list.InsertColumn(3, "Статус", width=100)
-        self.work_task_list.InsertColumn(4, "Срок", width=100)
-        self.work_task_list.InsertColumn(5, "Проект", width=120)
-        self.work_task_list.InsertColumn(6, "Исполнитель", width=120)
+        self.work_task_list = VirtualListCtrl(panel)
+        _setup_columns(self.work_task_list, self.WORK_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить задачу")
@@ -276,18 +520,18 @@ class TaskManagerApp(wx.Frame):
 
         # Фильтры
         filter_panel = wx.Panel(panel)
-        wx.StaticText(filter_panel, label="Фильтр по статусу:")
+        # Каждая подпись создается один раз и попадает в сайзер ниже —
+        # без второго, никуда не добавляемого экземпляра
+        lbl_status = wx.StaticText(filter_panel, label="Фильтр по статусу:")
         self.work_status_filter = wx.ComboBox(filter_panel, choices=["Все", "В ожидании", "В работе", "Завершено"],
                                               value="Все")
-        wx.StaticText(filter_panel, label="Фильтр по проекту:")
+        lbl_project = wx.StaticText(filter_panel, label="Фильтр по проекту:")
         self.work_project_filter = wx.ComboBox(filter_panel)
-        self.work_project_filter.Append("Все", None)
 
-        # Заполнение фильтра проектов
-        self.cursor.execute("SELECT name FROM projects")
-        projects = self.cursor.fetchall()
-        for project in projects:
-            self.work_project_filter.Append(project[0], project[0])
+        # Заполнение фильтра проектов из кэша одним вызовом Set —
+        # без запроса к БД при построении вкладки
+        self.work_project_filter.Set(["Все"] + sorted(self._projects))
+        self.work_project_filter.SetValue("Все")
 
         # Кнопка применения фильтра
         btn_apply_filter = wx.Button(filter_panel, label="Применить фильтр")
@@ -295,9 +539,9 @@ class TaskManagerApp(wx.Frame):
 
         # Размещение элементов
         filter_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по статусу:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_status, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.work_status_filter, 0, wx.EXPAND | wx.RIGHT, 10)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по проекту:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_project, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.work_project_filter, 0, wx.EXPAND | wx.RIGHT, 10)
         filter_sizer.Add(btn_apply_filter, 0, wx.EXPAND)
         filter_panel.SetSizer(filter_sizer)
@@ -339,14 +583,8 @@ class TaskManagerApp(wx.Frame):
         panel = self.study_tab
 
         # Список задач
-        self.study_task_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.study_task_list.InsertColumn(0, "ID", width=40)
-        self.study_task_list.InsertColumn(1, "Заголовок", width=200)
-        self.study_task_list.InsertColumn(2, "Курс", width=150)
-        self.study_task_list.InsertColumn(3, "Тема", width=150)
-        self.study_task_list.InsertColumn(4, "Приоритет", width=80)
-        self.study_task_list.InsertColumn(5, "Статус", width=100)
-        self.study_task_list.InsertColumn(6, "Срок", width=100)
+        self.study_task_list = VirtualListCtrl(panel)
+        _setup_columns(self.study_task_list, self.STUDY_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить задачу")
@@ -364,18 +602,14 @@ class TaskManagerApp(wx.Frame):
 
         # Фильтры
         filter_panel = wx.Panel(panel)
-        wx.StaticText(filter_panel, label="Фильтр по курсу:")
+        lbl_course = wx.StaticText(filter_panel, label="Фильтр по курсу:")
         self.study_course_filter = wx.ComboBox(filter_panel)
-        self.study_course_filter.Append("Все", None)
 
-        # Заполнение фильтра курсов
-        self.cursor.execute("SELECT DISTINCT course FROM study_tasks")
-        courses = self.cursor.fetchall()
-        for course in courses:
-            if course[0]:
-                self.study_course_filter.Append(course[0], course[0])
+        # Заполнение фильтра курсов из кэша одним вызовом Set
+        self.study_course_filter.Set(["Все"] + sorted(self._courses))
+        self.study_course_filter.SetValue("Все")
 
-        wx.StaticText(filter_panel, label="Фильтр по статусу:")
+        lbl_status = wx.StaticText(filter_panel, label="Фильтр по статусу:")
         self.study_status_filter = wx.ComboBox(filter_panel, choices=["Все", "В ожидании", "В работе", "Завершено"],
                                                value="Все")
 
@@ -385,21 +619,21 @@ class TaskManagerApp(wx.Frame):
 
         # Размещение элементов фильтра
         filter_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по курсу:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_course, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.study_course_filter, 0, wx.EXPAND | wx.RIGHT, 10)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по статусу:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_status, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.study_status_filter, 0, wx.EXPAND | wx.RIGHT, 10)
         filter_sizer.Add(btn_apply_filter, 0, wx.EXPAND)
         filter_panel.SetSizer(filter_sizer)
 
         # Прогресс обучения
         progress_panel = wx.Panel(panel)
-        wx.StaticText(progress_panel, label="Прогресс обучения:")
+        lbl_progress = wx.StaticText(progress_panel, label="Прогресс обучения:")
         self.study_progress = wx.Gauge(progress_panel, range=100)
 
         # Размещение элементов прогресса
         progress_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        progress_sizer.Add(wx.StaticText(progress_panel, label="Прогресс обучения:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        progress_sizer.Add(lbl_progress, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         progress_sizer.Add(self.study_progress, 1, wx.EXPAND)
         progress_panel.SetSizer(progress_sizer)
 
@@ -424,14 +658,8 @@ class TaskManagerApp(wx.Frame):
         panel = self.goals_tab
 
         # Список целей
-        self.goals_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.goals_list.InsertColumn(0, "ID", width=40)
-        self.goals_list.InsertColumn(1, "Цель", width=200)
-        self.goals_list.InsertColumn(2, "Категория", width=120)
-        self.goals_list.InsertColumn(3, "Прогресс", width=120)
-        self.goals_list.InsertColumn(4, "Приоритет", width=80)
-        self.goals_list.InsertColumn(5, "Статус", width=100)
-        self.goals_list.InsertColumn(6, "Срок", width=100)
+        self.goals_list = VirtualListCtrl(panel)
+        _setup_columns(self.goals_list, self.GOALS_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить цель")
@@ -449,18 +677,14 @@ class TaskManagerApp(wx.Frame):
 
         # Фильтры
         filter_panel = wx.Panel(panel)
-        wx.StaticText(filter_panel, label="Фильтр по категории:")
+        lbl_category = wx.StaticText(filter_panel, label="Фильтр по категории:")
         self.goal_category_filter = wx.ComboBox(filter_panel)
-        self.goal_category_filter.Append("Все", None)
 
-        # Заполнение фильтра категорий
-        self.cursor.execute("SELECT DISTINCT category FROM personal_goals")
-        categories = self.cursor.fetchall()
-        for category in categories:
-            if category[0]:
-                self.goal_category_filter.Append(category[0], category[0])
+        # Заполнение фильтра категорий из кэша одним вызовом Set
+        self.goal_category_filter.Set(["Все"] + sorted(self._categories))
+        self.goal_category_filter.SetValue("Все")
 
-        wx.StaticText(filter_panel, label="Фильтр по статусу:")
+        lbl_status = wx.StaticText(filter_panel, label="Фильтр по статусу:")
         self.goal_status_filter = wx.ComboBox(filter_panel, choices=["Все", "В ожидании", "В процессе", "Достигнуто"],
                                               value="Все")
 
@@ -470,9 +694,9 @@ class TaskManagerApp(wx.Frame):
 
         # Размещение элементов фильтра
         filter_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по категории:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_category, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.goal_category_filter, 0, wx.EXPAND | wx.RIGHT, 10)
-        filter_sizer.Add(wx.StaticText(filter_panel, label="Фильтр по статусу:"), 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
+        filter_sizer.Add(lbl_status, 0, wx.ALIGN_CENTER | wx.RIGHT, 5)
         filter_sizer.Add(self.goal_status_filter, 0, wx.EXPAND | wx.RIGHT, 10)
         filter_sizer.Add(btn_apply_filter, 0, wx.EXPAND)
         filter_panel.SetSizer(filter_sizer)
@@ -507,12 +731,8 @@ class TaskManagerApp(wx.Frame):
         panel = self.reminders_tab
 
         # Список напоминаний
-        self.reminders_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.reminders_list.InsertColumn(0, "ID", width=40)
-        self.reminders_list.InsertColumn(1, "Сообщение", width=300)
-        self.reminders_list.InsertColumn(2, "Время напоминания", width=150)
-        self.reminders_list.InsertColumn(3, "Повторение", width=100)
-        self.reminders_list.InsertColumn(4, "Статус", width=100)
+        self.reminders_list = VirtualListCtrl(panel)
+        _setup_columns(self.reminders_list, self.REMINDER_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить напоминание")
@@ -543,11 +763,7 @@ class TaskManagerApp(wx.Frame):
         """Создание вкладки для сотрудников"""
         # Список сотрудников
         self.employees_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.employees_list.InsertColumn(0, "ID", width=40)
-        self.employees_list.InsertColumn(1, "Имя", width=150)
-        self.employees_list.InsertColumn(2, "Должность", width=150)
-        self.employees_list.InsertColumn(3, "Email", width=150)
-        self.employees_list.InsertColumn(4, "Телефон", width=120)
+        _setup_columns(self.employees_list, self.EMPLOYEE_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить сотрудника")
@@ -575,12 +791,7 @@ class TaskManagerApp(wx.Frame):
         """Создание вкладки для проектов"""
         # Список проектов
         self.projects_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        self.projects_list.InsertColumn(0, "ID", width=40)
-        self.projects_list.InsertColumn(1, "Название", width=200)
-        self.projects_list.InsertColumn(2, "Статус", width=100)
-        self.projects_list.InsertColumn(3, "Начало", width=100)
-        self.projects_list.InsertColumn(4, "Завершение", width=100)
-        self.projects_list.InsertColumn(5, "Руководитель", width=150)
+        _setup_columns(self.projects_list, self.PROJECT_COLS)
 
         # Кнопки управления
         btn_add = wx.Button(panel, label="Добавить проект")
@@ -608,109 +819,152 @@ class TaskManagerApp(wx.Frame):
         panel.SetSizer(main_sizer)
 
     def load_data(self):
-        """Загрузка данных из базы данных"""
-        # Загрузка рабочих задач
-        self.load_work_tasks()
-
-        # Загрузка учебных задач
-        self.load_study_tasks()
-
-        # Загрузка целей
-        self.load_goals()
-
-        # Загрузка сотрудников
-        self.load_employees()
+        """Загрузка данных из базы данных.
 
-        # Загрузка проектов
-        self.load_projects()
+        Загружаются только уже построенные вкладки; данные ленивых
+        вкладок подтянутся при их первом открытии.
 
-        # Загрузка напоминаний
-        self.load_reminders()
+        Все стартовые запросы выполняются на одном курсоре внутри одной
+        транзакции: SQLite переиспользует кэш страниц между запросами и
+        не открывает/закрывает неявную транзакцию на каждый из них.
+        """
+        cur = self._cursor()
+        cur.execute("BEGIN")
+        try:
+            # Загрузка рабочих задач
+            self.load_work_tasks(cur=cur)
 
-        # Обновление статистики
-        self.update_stats()
+            # Загрузка учебных задач
+            if hasattr(self, 'study_task_list'):
+                self.load_study_tasks(cur=cur)
 
-    def load_work_tasks(self, status_filter=None, project_filter=None):
-        """Загрузка рабочих задач"""
-        self.work_task_list.DeleteAllItems()
+            # Загрузка целей
+            if hasattr(self, 'goals_list'):
+                self.load_goals(cur=cur)
 
-        query = "SELECT * FROM work_tasks"
-        params = []
+            # Загрузка сотрудников
+            self.load_employees(cur=cur)
 
-        if status_filter and status_filter != "Все":
-            query += " WHERE status = ?"
-            params.append(status_filter)
+            # Загрузка проектов
+            self.load_projects(cur=cur)
 
-            if project_filter and project_filter != "Все":
-                query += " AND project = ?"
-                params.append(project_filter)
-        elif project_filter and project_filter != "Все":
-            query += " WHERE project = ?"
-            params.append(project_filter)
+            # Загрузка напоминаний
+            if hasattr(self, 'reminders_list'):
+                self.load_reminders(cur=cur)
 
-        query += " ORDER BY deadline, priority"
+            # Обновление статистики
+            self.update_stats(cur=cur)
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
 
-        self.cursor.execute(query, params)
-        tasks = self.cursor.fetchall()
+    def load_work_tasks(self, status_filter=None, project_filter=None, cur=None):
+        """Загрузка рабочих задач"""
+        # Один канонический запрос на все комбинации фильтров: SQLite
+        # готовит одну программу VDBE и переиспользует ее при каждом
+        # клике "Применить фильтр" вместо перекомпиляции четырех
+        # вариантов склеенного SQL. Выбираются только отображаемые
+        # колонки: description и created_at не читаются из строки
+        if cur is None:
+            cur = self._cursor()
+        # LEFT JOIN сразу отдает имена проекта и исполнителя вместо их
+        # id — без дополнительных запросов или словарей на стороне
+        # Python. Фильтр по проекту сравнивает выбранное в комбобоксе
+        # имя с присоединенным p.name: в work_tasks.project хранится id
+        cur.execute(
+            '''SELECT w.id, w.title, w.priority, w.status, w.deadline,
+                      p.name AS project_name, e.name AS assignee,
+                      (w.deadline IS NOT NULL AND w.status != 'Завершено'
+                       AND w.deadline < datetime('now', 'localtime')) AS overdue
+               FROM work_tasks w
+               LEFT JOIN projects p ON p.id = w.project
+               LEFT JOIN employees e ON e.id = w.assigned_to
+               WHERE (:status IS NULL OR w.status = :status)
+                 AND (:project IS NULL OR p.name = :project)
+               ORDER BY w.deadline, w.priority''',
+            {
+                # Пустая строка — очищенный комбобокс, то есть "без фильтра"
+                "status": None if status_filter in (None, "", "Все") else status_filter,
+                "project": None if project_filter in (None, "", "Все") else project_filter,
+            }
+        )
 
-        for task in tasks:
-            idx = self.work_task_list.InsertItem(self.work_task_list.GetItemCount(), str(task[0]))
-            self.work_task_list.SetItem(idx, 1, task[1])
-            self.work_task_list.SetItem(idx, 2, str(task[3]))
-            self.work_task_list.SetItem(idx, 3, task[4])
-            self.work_task_list.SetItem(idx, 4, task[5] if task[5] else "")
-            self.work_task_list.SetItem(idx, 5, task[7] if task[7] else "")
-            self.work_task_list.SetItem(idx, 6, task[8] if task[8] else "")
+        rows = []
+        overdue = []
+        # Признак просроченности вычисляется на стороне SQLite (колонка
+        # overdue в SELECT) — Python не парсит и не сравнивает даты.
+        # Курсор читается итерацией — без полного снимка от fetchall
+        for task in cur:
+            deadline = task['deadline']
+            rows.append((
+                str(task['id']),
+                task['title'],
+                str(task['priority']),
+                task['status'],
+                deadline if deadline else "",
+                task['project_name'] if task['project_name'] else "",
+                task['assignee'] if task['assignee'] else "",
+            ))
 
             # Подсветка просроченных задач
-            if task[5] and task[4] != "Завершено":
-                deadline = datetime.strptime(task[5], "%Y-%m-%d %H:%M:%S")
-                if deadline < datetime.now():
-                    self.work_task_list.SetItemTextColour(idx, wx.RED)
-
-    def load_study_tasks(self, course_filter=None, status_filter=None):
-        """Загрузка учебных задач"""
-        self.study_task_list.DeleteAllItems()
+            if task['overdue']:
+                overdue.append(len(rows) - 1)
 
-        query = "SELECT * FROM study_tasks"
-        params = []
-
-        if course_filter and course_filter != "Все":
-            query += " WHERE course = ?"
-            params.append(course_filter)
+        self.work_task_list.set_rows(rows, overdue)
 
-            if status_filter and status_filter != "Все":
-                query += " AND status = ?"
-                params.append(status_filter)
-        elif status_filter and status_filter != "Все":
-            query += " WHERE status = ?"
-            params.append(status_filter)
-
-        query += " ORDER BY deadline, priority"
-
-        self.cursor.execute(query, params)
-        tasks = self.cursor.fetchall()
+    def load_study_tasks(self, course_filter=None, status_filter=None, cur=None):
+        """Загрузка учебных задач"""
+        # Канонический запрос с параметрами вместо склейки SQL,
+        # как в load_work_tasks
+        if cur is None:
+            cur = self._cursor()
+        cur.execute(
+            '''SELECT id, title, course, topic, priority, status, deadline,
+                      (deadline IS NOT NULL AND status != 'Завершено'
+                       AND deadline < datetime('now', 'localtime')) AS overdue
+               FROM study_tasks
+               WHERE (:course IS NULL OR course = :course)
+                 AND (:status IS NULL OR status = :status)
+               ORDER BY deadline, priority''',
+            {
+                # Пустая строка означает "без фильтра", как в load_work_tasks
+                "course": None if course_filter in (None, "", "Все") else course_filter,
+                "status": None if status_filter in (None, "", "Все") else status_filter,
+            }
+        )
 
-        for task in tasks:
-            idx = self.study_task_list.InsertItem(self.study_task_list.GetItemCount(), str(task[0]))
-            self.study_task_list.SetItem(idx, 1, task[1])
-            self.study_task_list.SetItem(idx, 2, task[7] if task[7] else "")
-            self.study_task_list.SetItem(idx, 3, task[8] if task[8] else "")
-            self.study_task_list.SetItem(idx, 4, str(task[3]))
-            self.study_task_list.SetItem(idx, 5, task[4])
-            self.study_task_list.SetItem(idx, 6, task[5] if task[5] else "")
+        rows = []
+        overdue = []
+        # Признак просроченности считает SQLite, а курсор читается
+        # итерацией, как в load_work_tasks
+        for task in cur:
+            deadline = task['deadline']
+            rows.append((
+                str(task['id']),
+                task['title'],
+                task['course'] if task['course'] else "",
+                task['topic'] if task['topic'] else "",
+                str(task['priority']),
+                task['status'],
+                deadline if deadline else "",
+            ))
 
             # Подсветка просроченных задач
-            if task[5] and task[4] != "Завершено":
-                deadline = datetime.strptime(task[5], "%Y-%m-%d %H:%M:%S")
-                if deadline < datetime.now():
-                    self.study_task_list.SetItemTextColour(idx, wx.RED)
+            if task['overdue']:
+                overdue.append(len(rows) - 1)
 
-    def load_goals(self, category_filter=None, status_filter=None):
-        """Загрузка личных целей"""
-        self.goals_list.DeleteAllItems()
+        self.study_task_list.set_rows(rows, overdue)
 
-        query = "SELECT * FROM personal_goals"
+    def load_goals(self, category_filter=None, status_filter=None, cur=None):
+        """Загрузка личных целей"""
+        # Выбираются только отображаемые колонки: description и
+        # created_at не читаются из строки
+        query = ("SELECT id, title, category, priority, status, deadline,"
+                 " target_value, current_value,"
+                 " (deadline IS NOT NULL AND status != 'Достигнуто'"
+                 " AND deadline < datetime('now', 'localtime')) AS overdue"
+                 " FROM personal_goals")
         params = []
 
         if category_filter and category_filter != "Все":
@@ -726,143 +980,209 @@ class TaskManagerApp(wx.Frame):
 
         query += " ORDER BY deadline, priority"
 
-        self.cursor.execute(query, params)
-        goals = self.cursor.fetchall()
-
-        for goal in goals:
-            idx = self.goals_list.InsertItem(self.goals_list.GetItemCount(), str(goal[0]))
-            self.goals_list.SetItem(idx, 1, goal[1])
-            self.goals_list.SetItem(idx, 2, goal[7] if goal[7] else "")
-
-            # Расчет прогресса
-            if goal[8] and goal[9] is not None:
-                progress = f"{goal[9]}/{goal[8]} ({int((goal[9] / goal[8]) * 100)}%)" if goal[8] != 0 else "0/0 (0%)"
-                self.goals_list.SetItem(idx, 3, progress)
+        if cur is None:
+            cur = self._cursor()
+        cur.execute(query, params)
+
+        rows = []
+        overdue = []
+        # Признак просроченности считает SQLite, а курсор читается
+        # итерацией, как в load_work_tasks
+        for goal in cur:
+            target = goal['target_value']
+            current = goal['current_value']
+            deadline = goal['deadline']
+
+            # Расчет прогресса: целочисленное деление вместо пары
+            # float-операций; target уже проверен на истинность, поэтому
+            # отдельная ветка "0/0 (0%)" не нужна
+            if target and current is not None:
+                progress = f"{current}/{target} ({int(current * 100 // target)}%)"
             else:
-                self.goals_list.SetItem(idx, 3, "N/A")
-
-            self.goals_list.SetItem(idx, 4, str(goal[3]))
-            self.goals_list.SetItem(idx, 5, goal[4])
-            self.goals_list.SetItem(idx, 6, goal[5] if goal[5] else "")
+                progress = "N/A"
+
+            rows.append((
+                str(goal['id']),
+                goal['title'],
+                goal['category'] if goal['category'] else "",
+                progress,
+                str(goal['priority']),
+                goal['status'],
+                deadline if deadline else "",
+            ))
 
             # Подсветка просроченных целей
-            if goal[5] and goal[4] != "Достигнуто":
-                deadline = datetime.strptime(goal[5], "%Y-%m-%d %H:%M:%S")
-                if deadline < datetime.now():
-                    self.goals_list.SetItemTextColour(idx, wx.RED)
-
-    def load_employees(self):
-        """Загрузка списка сотрудников"""
-        self.employees_list.DeleteAllItems()
-
-        self.cursor.execute("SELECT * FROM employees ORDER BY name")
-        employees = self.cursor.fetchall()
+            if goal['overdue']:
+                overdue.append(len(rows) - 1)
 
-        for emp in employees:
-            idx = self.employees_list.InsertItem(self.employees_list.GetItemCount(), str(emp[0]))
-            self.employees_list.SetItem(idx, 1, emp[1])
-            self.employees_list.SetItem(idx, 2, emp[2] if emp[2] else "")
-            self.employees_list.SetItem(idx, 3, emp[3] if emp[3] else "")
-            self.employees_list.SetItem(idx, 4, emp[4] if emp[4] else "")
+        self.goals_list.set_rows(rows, overdue)
 
-    def load_projects(self):
+    def load_employees(self, cur=None):
+        """Загрузка списка сотрудников"""
+        if cur is None:
+            cur = self._cursor()
+        # notes в списке не показываются — колонка не выбирается
+        cur.execute("SELECT id, name, position, email, phone FROM employees ORDER BY name")
+        employees = cur.fetchall()
+
+        # Freeze/Thaw: одна перерисовка списка вместо перерисовки
+        # после каждого InsertItem/SetItem
+        self.employees_list.Freeze()
+        try:
+            self.employees_list.DeleteAllItems()
+            # Методы списка и счетчик строк в локальных переменных:
+            # без повторного поиска атрибутов и GetItemCount на каждой
+            # итерации
+            insert = self.employees_list.InsertItem
+            set_item = self.employees_list.SetItem
+            count = 0
+            for emp in employees:
+                idx = insert(count, str(emp['id']))
+                count += 1
+                set_item(idx, 1, emp['name'])
+                set_item(idx, 2, emp['position'] if emp['position'] else "")
+                set_item(idx, 3, emp['email'] if emp['email'] else "")
+                set_item(idx, 4, emp['phone'] if emp['phone'] else "")
+        finally:
+            self.employees_list.Thaw()
+
+    def load_projects(self, cur=None):
         """Загрузка списка проектов"""
-        self.projects_list.DeleteAllItems()
-
-        self.cursor.execute("SELECT * FROM projects ORDER BY end_date, start_date")
-        projects = self.cursor.fetchall()
-
-        for proj in projects:
-            idx = self.projects_list.InsertItem(self.projects_list.GetItemCount(), str(proj[0]))
-            self.projects_list.SetItem(idx, 1, proj[1])
-            self.projects_list.SetItem(idx, 2, proj[5])
-            self.projects_list.SetItem(idx, 3, proj[3] if proj[3] else "")
-            self.projects_list.SetItem(idx, 4, proj[4] if proj[4] else "")
-            self.projects_list.SetItem(idx, 5, proj[6] if proj[6] else "")
-
-            # Подсветка просроченных проектов
-            if proj[4] and proj[5] != "Завершен":
-                end_date = datetime.strptime(proj[4], "%Y-%m-%d %H:%M:%S")
-                if end_date < datetime.now():
+        if cur is None:
+            cur = self._cursor()
+        cur.execute(
+            "SELECT id, name, status, start_date, end_date, manager,"
+            " (end_date IS NOT NULL AND status != 'Завершен'"
+            " AND end_date < datetime('now', 'localtime')) AS overdue"
+            " FROM projects ORDER BY end_date, start_date")
+        projects = cur.fetchall()
+
+        # Freeze/Thaw: одна перерисовка списка, как в load_employees
+        self.projects_list.Freeze()
+        try:
+            self.projects_list.DeleteAllItems()
+            # Локальные ссылки на методы и ручной счетчик строк,
+            # как в load_employees
+            insert = self.projects_list.InsertItem
+            set_item = self.projects_list.SetItem
+            count = 0
+            for proj in projects:
+                idx = insert(count, str(proj['id']))
+                count += 1
+                set_item(idx, 1, proj['name'])
+                set_item(idx, 2, proj['status'])
+                set_item(idx, 3, proj['start_date'] if proj['start_date'] else "")
+                set_item(idx, 4, proj['end_date'] if proj['end_date'] else "")
+                set_item(idx, 5, proj['manager'] if proj['manager'] else "")
+
+                # Подсветка просроченных проектов
+                if proj['overdue']:
                     self.projects_list.SetItemTextColour(idx, wx.RED)
+        finally:
+            self.projects_list.Thaw()
 
-    def load_reminders(self):
+    def load_reminders(self, cur=None):
         """Загрузка напоминаний"""
-        self.reminders_list.DeleteAllItems()
-
-        self.cursor.execute("SELECT * FROM reminders WHERE is_completed = 0 ORDER BY remind_time")
-        reminders = self.cursor.fetchall()
-
-        for rem in reminders:
-            idx = self.reminders_list.InsertItem(self.reminders_list.GetItemCount(), str(rem[0]))
-            self.reminders_list.SetItem(idx, 1, rem[1])
-            self.reminders_list.SetItem(idx, 2, rem[2])
-
-            if rem[3]:  # is_recurring
-                recurring_text = f"Каждые {rem[4]} {rem[5]}"
-                self.reminders_list.SetItem(idx, 3, recurring_text)
+        if cur is None:
+            cur = self._cursor()
+        cur.execute(
+            "SELECT id, message, remind_time, is_recurring, recurring_interval,"
+            " recurring_unit, (remind_time < datetime('now', 'localtime')) AS overdue"
+            " FROM reminders WHERE is_completed = 0 ORDER BY remind_time")
+
+        rows = []
+        overdue = []
+        # Признак просроченности считает SQLite, а курсор читается
+        # итерацией, как в load_work_tasks
+        for rem in cur:
+            if rem['is_recurring']:
+                recurring_text = f"Каждые {rem['recurring_interval']} {rem['recurring_unit']}"
             else:
-                self.reminders_list.SetItem(idx, 3, "Однократно")
+                recurring_text = "Однократно"
 
-            self.reminders_list.SetItem(idx, 4, "Активно")
+            rows.append((str(rem['id']), rem['message'], rem['remind_time'],
+                         recurring_text, "Активно"))
 
             # Подсветка просроченных напоминаний
-            remind_time = datetime.strptime(rem[2], "%Y-%m-%d %H:%M:%S")
-            if remind_time < datetime.now():
-                self.reminders_list.SetItemTextColour(idx, wx.RED)
-
-    def update_stats(self):
-        """Обновление статистики"""
-        # Статистика по рабочим задачам
-        self.cursor.execute("SELECT COUNT(*) FROM work_tasks")
-        total_work_tasks = self.cursor.fetchone()[0]
-
-        self.cursor.execute("SELECT COUNT(*) FROM work_tasks WHERE status = 'Завершено'")
-        completed_work_tasks = self.cursor.fetchone()[0]
-
-        # Статистика по учебным задачам
-        self.cursor.execute("SELECT COUNT(*) FROM study_tasks")
-        total_study_tasks = self.cursor.fetchone()[0]
-
-        self.cursor.execute("SELECT COUNT(*) FROM study_tasks WHERE status = 'Завершено'")
-        completed_study_tasks = self.cursor.fetchone()[0]
+            if rem['overdue']:
+                overdue.append(len(rows) - 1)
+
+        self.reminders_list.set_rows(rows, overdue)
+
+    def update_stats(self, cur=None):
+        """Пересчет статистики из БД (начальная загрузка и удаления)"""
+        if cur is None:
+            cur = self._cursor()
+        if not hasattr(self, '_stats'):
+            self._stats = {}
+
+        # Все шесть COUNT(*) одним запросом: один разбор SQL и один
+        # переход Python<->SQLite вместо шести
+        cur.execute(
+            '''SELECT
+                   (SELECT COUNT(*) FROM work_tasks),
+                   (SELECT COUNT(*) FROM work_tasks WHERE status = 'Завершено'),
+                   (SELECT COUNT(*) FROM study_tasks),
+                   (SELECT COUNT(*) FROM study_tasks WHERE status = 'Завершено'),
+                   (SELECT COUNT(*) FROM personal_goals),
+                   (SELECT COUNT(*) FROM personal_goals WHERE status = 'Достигнуто')'''
+        )
+        (self._stats['work_total'], self._stats['work_done'],
+         self._stats['study_total'], self._stats['study_done'],
+         self._stats['goals_total'], self._stats['goals_done']) = cur.fetchone()
 
-        # Статистика по целям
-        self.cursor.execute("SELECT COUNT(*) FROM personal_goals")
-        total_goals = self.cursor.fetchone()[0]
+        self._refresh_status_bar()
 
-        self.cursor.execute("SELECT COUNT(*) FROM personal_goals WHERE status = 'Достигнуто'")
-        completed_goals = self.cursor.fetchone()[0]
+    def _refresh_status_bar(self):
+        """Перерисовка статистики из кэшированных счетчиков _stats.
 
-        # Обновление строки состояния
-        work_stats = f"Работа: {completed_work_tasks}/{total_work_tasks}"
-        study_stats = f"Учеба: {completed_study_tasks}/{total_study_tasks}"
-        goals_stats = f"Цели: {completed_goals}/{total_goals}"
+        Обработчики завершения корректируют счетчики на месте и зовут
+        этот метод — без повторных COUNT(*) по всем таблицам.
+        """
+        s = self._stats
+        work_stats = f"Работа: {s['work_done']}/{s['work_total']}"
+        study_stats = f"Учеба: {s['study_done']}/{s['study_total']}"
+        goals_stats = f"Цели: {s['goals_done']}/{s['goals_total']}"
 
         self.status_bar.SetStatusText(f"{work_stats} | {study_stats} | {goals_stats}", 0)
 
-        # Обновление прогресса обучения
-        if total_study_tasks > 0:
-            progress = int((completed_study_tasks / total_study_tasks) * 100)
+        # Обновление прогресса обучения (виджет есть только после
+        # построения вкладки "Учеба")
+        if s['study_total'] > 0 and hasattr(self, 'study_progress'):
+            progress = int((s['study_done'] / s['study_total']) * 100)
             self.study_progress.SetValue(progress)
 
-        # Обновление статистики целей
-        if total_goals > 0:
-            completion_percent = int((completed_goals / total_goals) * 100)
-            self.goals_stats_text.SetLabel(
-                f"Всего целей: {total_goals} | Завершено: {completed_goals} ({completion_percent}%)"
-            )
-        else:
-            self.goals_stats_text.SetLabel("Всего целей: 0 | Завершено: 0 (0%)")
+        # Обновление статистики целей (аналогично — вкладка "Цели")
+        if hasattr(self, 'goals_stats_text'):
+            if s['goals_total'] > 0:
+                completion_percent = int((s['goals_done'] / s['goals_total']) * 100)
+                self.goals_stats_text.SetLabel(
+                    f"Всего целей: {s['goals_total']} | Завершено: {s['goals_done']} ({completion_percent}%)"
+                )
+            else:
+                self.goals_stats_text.SetLabel("Всего целей: 0 | Завершено: 0 (0%)")
+
+    def _wake_reminder_thread(self):
+        """Разбудить поток напоминаний после изменения напоминаний"""
+        with self._rem_cv:
+            self._rem_dirty = True
+            self._rem_cv.notify()
 
     def check_reminders(self):
-        """Проверка напоминаний в фоновом режиме"""
+        """Проверка напоминаний в фоновом режиме.
+
+        Поток спит ровно до ближайшего remind_time и дополнительно
+        будится через _wake_reminder_thread при добавлении, изменении
+        или удалении напоминаний — никакого опроса БД раз в минуту.
+        """
+        # Соединение и курсор этого потока создаются один раз на все
+        # время жизни цикла: WAL уже включен фабрикой соединений, поэтому
+        # фоновые коммиты не блокируют чтения GUI-потока
+        conn = self._connection()
+        cursor = conn.cursor()
+
         while self.reminder_active:
             try:
-                # Создаем новое соединение с БД для этого потока
-                conn = sqlite3.connect('taskmanager.db')
-                cursor = conn.cursor()
-
                 now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
                 # Проверка активных напоминаний
@@ -872,25 +1192,62 @@ class TaskManagerApp(wx.Frame):
                 )
                 reminders = cursor.fetchall()
 
+                # Все изменения пачки пишутся одной транзакцией:
+                # N сработавших напоминаний стоят один fsync, а не N
+                completed = []
+                rescheduled = []
                 for reminder in reminders:
-                    # Помещаем напоминание в очередь для обработки в главном потоке
-                    self.reminder_queue.put(reminder)
+                    # Передаем напоминание в главный поток для показа
+                    wx.CallAfter(self._on_reminder_fired, reminder)
 
                     # Обработка повторяющихся напоминаний
                     if reminder[3]:  # is_recurring
-                        self.update_recurring_reminder(cursor, reminder)
+                        update = self.update_recurring_reminder(reminder)
+                        if update:
+                            rescheduled.append(update)
                     else:
                         # Пометить как выполненное для однократных напоминаний
-                        cursor.execute(
+                        completed.append((reminder[0],))
+
+                if completed or rescheduled:
+                    cursor.execute("BEGIN")
+                    try:
+                        cursor.executemany(
                             "UPDATE reminders SET is_completed = 1 WHERE id = ?",
-                            (reminder[0],)
+                            completed
                         )
-                        conn.commit()
-
-                conn.close()
-
-                # Проверка каждую минуту
-                time.sleep(60)
+                        cursor.executemany(
+                            "UPDATE reminders SET remind_time = ? WHERE id = ?",
+                            rescheduled
+                        )
+                        cursor.execute("COMMIT")
+                    except Exception:
+                        # Откат обязателен: незакрытая транзакция ломала
+                        # бы BEGIN всех следующих итераций цикла
+                        cursor.execute("ROLLBACK")
+                        raise
+
+                # Засыпаем до ближайшего активного напоминания;
+                # notify() из обработчиков CRUD прерывает ожидание раньше
+                cursor.execute(
+                    "SELECT MIN(remind_time) FROM reminders WHERE is_completed = 0"
+                )
+                next_time = cursor.fetchone()[0]
+                if next_time:
+                    next_dt = datetime.strptime(next_time, "%Y-%m-%d %H:%M:%S")
+                    # Минимум может оставаться в прошлом (например,
+                    # повторяющееся напоминание после сна системы
+                    # перенесено на все еще прошедшее время) — короткая
+                    # пауза и немедленная повторная проверка вместо
+                    # вечного ожидания
+                    delay = max(1.0, (next_dt - datetime.now()).total_seconds())
+                else:
+                    delay = None  # напоминаний нет — ждем notify()
+
+                with self._rem_cv:
+                    if not self._rem_dirty:
+                        self._rem_cv.wait(timeout=delay)
+                    self._rem_dirty = False
 
             except Exception as e:
                 print(f"Ошибка в потоке напоминаний: {e}")
@@ -907,33 +1264,33 @@ class TaskManagerApp(wx.Frame):
         dlg.ShowModal()
         dlg.Destroy()
 
-    def update_recurring_reminder(self, cursor, reminder):
-        """Обновление времени для повторяющегося напоминания"""
+    def update_recurring_reminder(self, reminder):
+        """Вычисление нового времени повторяющегося напоминания.
+
+        Чистая арифметика без SQL: возвращает пару (new_time, id)
+        для executemany в check_reminders или None при неизвестной
+        единице интервала.
+        """
         remind_time = datetime.strptime(reminder[2], "%Y-%m-%d %H:%M:%S")
         interval = reminder[4]
         unit = reminder[5]
 
-        if unit == "minutes":
-            new_time = remind_time + timedelta(minutes=interval)
-        elif unit == "hours":
-            new_time = remind_time + timedelta(hours=interval)
-        elif unit == "days":
-            new_time = remind_time + timedelta(days=interval)
-        elif unit == "weeks":
-            new_time = remind_time + timedelta(weeks=interval)
+        if unit in _UNIT_SECONDS:
+            # Единицы фиксированной длины — одна табличная выборка
+            # вместо цепочки elif с отдельными timedelta
+            new_time = remind_time + timedelta(seconds=interval * _UNIT_SECONDS[unit])
         elif unit == "months":
-            # Приблизительно, так как months в timedelta нет
-            new_time = remind_time.replace(
-                year=remind_time.year + (remind_time.month + interval - 1) // 12,
-                month=(remind_time.month + interval - 1) % 12 + 1
-            )
+            # Месяцы считаются по календарю, так как months в timedelta
+            # нет; день зажимается до длины целевого месяца (31 января
+            # + месяц — это 28/29 февраля, а не исключение)
+            year = remind_time.year + (remind_time.month + interval - 1) // 12
+            month = (remind_time.month + interval - 1) % 12 + 1
+            day = min(remind_time.day, calendar.monthrange(year, month)[1])
+            new_time = remind_time.replace(year=year, month=month, day=day)
         else:
-            return
+            return None
 
-        cursor.execute(
-            "UPDATE reminders SET remind_time = ? WHERE id = ?",
-            (new_time.strftime("%Y-%m-%d %H:%M:%S"), reminder[0])
-        )
+        return (new_time.strftime("%Y-%m-%d %H:%M:%S"), reminder[0])
 
     # Обработчики событий для вкладки "Работа"
     def on_add_work_task(self, event):
@@ -942,13 +1299,14 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             task_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO work_tasks 
                 (title, description, priority, status, deadline, project, assigned_to, category)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
                 task_data
             )
-            self.conn.commit()
+            cur.connection.commit()
             self.load_work_tasks()
             self.update_stats()
 
@@ -962,8 +1320,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         task_id = int(self.work_task_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM work_tasks WHERE id = ?", (task_id,))
-        task_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM work_tasks WHERE id = ?", (task_id,))
+        task_data = cur.fetchone()
 
         dlg = WorkTaskDialog(self, title="Редактировать рабочую задачу")
         dlg.set_data(task_data)
@@ -971,14 +1330,14 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE work_tasks 
                 SET title = ?, description = ?, priority = ?, status = ?, 
                     deadline = ?, project = ?, assigned_to = ?, category = ?
                 WHERE id = ?''',
                 (*updated_data, task_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
             self.load_work_tasks()
             self.update_stats()
 
@@ -1000,10 +1359,19 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM work_tasks WHERE id = ?", (task_id,))
-            self.conn.commit()
-            self.load_work_tasks()
-            self.update_stats()
+            cur = self._cursor()
+            # Удаление и перечитывание списка идут одной явной
+            # транзакцией: BEGIN IMMEDIATE сразу берет блокировку
+            # записи, не споря с потоком напоминаний, а COMMIT один
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM work_tasks WHERE id = ?", (task_id,))
+                self.load_work_tasks(cur=cur)
+                self.update_stats(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     def on_complete_work_task(self, event):
         """Пометить рабочую задачу как завершенную"""
@@ -1013,14 +1381,20 @@ class TaskManagerApp(wx.Frame):
             return
 
         task_id = int(self.work_task_list.GetItemText(selected))
+        already_done = self.work_task_list.GetItemText(selected, 3) == "Завершено"
 
-        self.cursor.execute(
+        cur = self._cursor()
+        cur.execute(
             "UPDATE work_tasks SET status = 'Завершено' WHERE id = ?",
             (task_id,)
         )
-        self.conn.commit()
-        self.load_work_tasks()
-        self.update_stats()
+        cur.connection.commit()
+        # Точечное обновление строки и счетчика вместо полной
+        # перезагрузки списка и пересчета COUNT(*) по всем таблицам
+        self.work_task_list.update_cell(selected, 3, "Завершено", clear_overdue=True)
+        if not already_done:
+            self._stats['work_done'] += 1
+            self._refresh_status_bar()
 
     def on_apply_work_filter(self, event):
         """Применение фильтров для рабочих задач"""
@@ -1036,13 +1410,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             task_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO study_tasks 
                 (title, description, priority, status, deadline, course, topic, resource_url)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
                 task_data
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._add_filter_value(self._courses, task_data[5], 'study_course_filter')
             self.load_study_tasks()
             self.update_stats()
 
@@ -1056,8 +1432,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         task_id = int(self.study_task_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM study_tasks WHERE id = ?", (task_id,))
-        task_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM study_tasks WHERE id = ?", (task_id,))
+        task_data = cur.fetchone()
 
         dlg = StudyTaskDialog(self, title="Редактировать учебную задачу")
         dlg.set_data(task_data)
@@ -1065,14 +1442,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE study_tasks 
                 SET title = ?, description = ?, priority = ?, status = ?, 
                     deadline = ?, course = ?, topic = ?, resource_url = ?
                 WHERE id = ?''',
                 (*updated_data, task_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._add_filter_value(self._courses, updated_data[5], 'study_course_filter')
             self.load_study_tasks()
             self.update_stats()
 
@@ -1094,10 +1472,18 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM study_tasks WHERE id = ?", (task_id,))
-            self.conn.commit()
-            self.load_study_tasks()
-            self.update_stats()
+            cur = self._cursor()
+            # Одна явная транзакция, как в on_delete_work_task
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM study_tasks WHERE id = ?", (task_id,))
+                self._reload_filter_values('_courses', 'course', 'study_tasks', 'study_course_filter')
+                self.load_study_tasks(cur=cur)
+                self.update_stats(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     def on_complete_study_task(self, event):
         """Пометить учебную задачу как завершенную"""
@@ -1107,14 +1493,19 @@ class TaskManagerApp(wx.Frame):
             return
 
         task_id = int(self.study_task_list.GetItemText(selected))
+        already_done = self.study_task_list.GetItemText(selected, 5) == "Завершено"
 
-        self.cursor.execute(
+        cur = self._cursor()
+        cur.execute(
             "UPDATE study_tasks SET status = 'Завершено' WHERE id = ?",
             (task_id,)
         )
-        self.conn.commit()
-        self.load_study_tasks()
-        self.update_stats()
+        cur.connection.commit()
+        # Точечное обновление, как в on_complete_work_task
+        self.study_task_list.update_cell(selected, 5, "Завершено", clear_overdue=True)
+        if not already_done:
+            self._stats['study_done'] += 1
+            self._refresh_status_bar()
 
     def on_open_study_resource(self, event):
         """Открытие учебного ресурса"""
@@ -1124,8 +1515,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         task_id = int(self.study_task_list.GetItemText(selected))
-        self.cursor.execute("SELECT resource_url FROM study_tasks WHERE id = ?", (task_id,))
-        url = self.cursor.fetchone()[0]
+        cur = self._cursor()
+        cur.execute("SELECT resource_url FROM study_tasks WHERE id = ?", (task_id,))
+        url = cur.fetchone()[0]
 
         if url:
             webbrowser.open(url)
@@ -1146,13 +1538,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             goal_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO personal_goals 
                 (title, description, priority, status, deadline, category, target_value, current_value)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
                 goal_data
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._add_filter_value(self._categories, goal_data[5], 'goal_category_filter')
             self.load_goals()
             self.update_stats()
 
@@ -1166,8 +1560,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         goal_id = int(self.goals_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM personal_goals WHERE id = ?", (goal_id,))
-        goal_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM personal_goals WHERE id = ?", (goal_id,))
+        goal_data = cur.fetchone()
 
         dlg = GoalDialog(self, title="Редактировать цель")
         dlg.set_data(goal_data)
@@ -1175,14 +1570,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE personal_goals 
                 SET title = ?, description = ?, priority = ?, status = ?, 
                     deadline = ?, category = ?, target_value = ?, current_value = ?
                 WHERE id = ?''',
                 (*updated_data, goal_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._add_filter_value(self._categories, updated_data[5], 'goal_category_filter')
             self.load_goals()
             self.update_stats()
 
@@ -1204,10 +1600,18 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM personal_goals WHERE id = ?", (goal_id,))
-            self.conn.commit()
-            self.load_goals()
-            self.update_stats()
+            cur = self._cursor()
+            # Одна явная транзакция, как в on_delete_work_task
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM personal_goals WHERE id = ?", (goal_id,))
+                self._reload_filter_values('_categories', 'category', 'personal_goals', 'goal_category_filter')
+                self.load_goals(cur=cur)
+                self.update_stats(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     def on_complete_goal(self, event):
         """Пометить цель как достигнутую"""
@@ -1217,14 +1621,19 @@ class TaskManagerApp(wx.Frame):
             return
 
         goal_id = int(self.goals_list.GetItemText(selected))
+        already_done = self.goals_list.GetItemText(selected, 5) == "Достигнуто"
 
-        self.cursor.execute(
+        cur = self._cursor()
+        cur.execute(
             "UPDATE personal_goals SET status = 'Достигнуто' WHERE id = ?",
             (goal_id,)
         )
-        self.conn.commit()
-        self.load_goals()
-        self.update_stats()
+        cur.connection.commit()
+        # Точечное обновление, как в on_complete_work_task
+        self.goals_list.update_cell(selected, 5, "Достигнуто", clear_overdue=True)
+        if not already_done:
+            self._stats['goals_done'] += 1
+            self._refresh_status_bar()
 
     def on_update_goal_progress(self, event):
         """Обновление прогресса цели"""
@@ -1234,8 +1643,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         goal_id = int(self.goals_list.GetItemText(selected))
-        self.cursor.execute("SELECT target_value, current_value FROM personal_goals WHERE id = ?", (goal_id,))
-        target, current = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT target_value, current_value FROM personal_goals WHERE id = ?", (goal_id,))
+        target, current = cur.fetchone()
 
         if target is None:
             wx.MessageBox("Для этой цели не установлен целевой показатель", "Ошибка", wx.OK | wx.ICON_WARNING)
@@ -1252,19 +1662,19 @@ class TaskManagerApp(wx.Frame):
             try:
                 new_value = float(dlg.GetValue())
 
-                self.cursor.execute(
+                cur.execute(
                     "UPDATE personal_goals SET current_value = ? WHERE id = ?",
                     (new_value, goal_id)
                 )
-                self.conn.commit()
+                cur.connection.commit()
 
                 # Автоматически завершить цель, если достигнут целевой показатель
                 if new_value >= target:
-                    self.cursor.execute(
+                    cur.execute(
                         "UPDATE personal_goals SET status = 'Достигнуто' WHERE id = ?",
                         (goal_id,)
                     )
-                    self.conn.commit()
+                    cur.connection.commit()
 
                 self.load_goals()
                 self.update_stats()
@@ -1287,14 +1697,16 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             reminder_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO reminders 
                 (message, remind_time, is_recurring, recurring_interval, recurring_unit)
                 VALUES (?, ?, ?, ?, ?)''',
                 reminder_data
             )
-            self.conn.commit()
+            cur.connection.commit()
             self.load_reminders()
+            self._wake_reminder_thread()
 
         dlg.Destroy()
 
@@ -1306,8 +1718,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         reminder_id = int(self.reminders_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,))
-        reminder_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM reminders WHERE id = ?", (reminder_id,))
+        reminder_data = cur.fetchone()
 
         dlg = ReminderDialog(self, title="Редактировать напоминание")
         dlg.set_data(reminder_data)
@@ -1315,15 +1728,16 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE reminders 
                 SET message = ?, remind_time = ?, is_recurring = ?, 
                     recurring_interval = ?, recurring_unit = ?
                 WHERE id = ?''',
                 (*updated_data, reminder_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
             self.load_reminders()
+            self._wake_reminder_thread()
 
         dlg.Destroy()
 
@@ -1343,9 +1757,17 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
-            self.conn.commit()
-            self.load_reminders()
+            cur = self._cursor()
+            # Одна явная транзакция, как в on_delete_work_task
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+                self.load_reminders(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+            self._wake_reminder_thread()
 
     def on_complete_reminder(self, event):
         """Пометить напоминание как выполненное"""
@@ -1356,12 +1778,14 @@ class TaskManagerApp(wx.Frame):
 
         reminder_id = int(self.reminders_list.GetItemText(selected))
 
-        self.cursor.execute(
+        cur = self._cursor()
+        cur.execute(
             "UPDATE reminders SET is_completed = 1 WHERE id = ?",
             (reminder_id,)
         )
-        self.conn.commit()
+        cur.connection.commit()
         self.load_reminders()
+        self._wake_reminder_thread()
 
     # Обработчики событий для сотрудников
     def on_add_employee(self, event):
@@ -1370,13 +1794,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             employee_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO employees 
                 (name, position, email, phone, notes)
                 VALUES (?, ?, ?, ?, ?)''',
                 employee_data
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._employees_cache = None
             self.load_employees()
 
         dlg.Destroy()
@@ -1389,8 +1815,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         employee_id = int(self.employees_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM employees WHERE id = ?", (employee_id,))
-        employee_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM employees WHERE id = ?", (employee_id,))
+        employee_data = cur.fetchone()
 
         dlg = EmployeeDialog(self, title="Редактировать сотрудника")
         dlg.set_data(employee_data)
@@ -1398,13 +1825,14 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE employees 
                 SET name = ?, position = ?, email = ?, phone = ?, notes = ?
                 WHERE id = ?''',
                 (*updated_data, employee_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._employees_cache = None
             self.load_employees()
 
         dlg.Destroy()
@@ -1419,10 +1847,13 @@ class TaskManagerApp(wx.Frame):
         employee_id = int(self.employees_list.GetItemText(selected))
 
         # Проверить, есть ли задачи, связанные с этим сотрудником
-        self.cursor.execute("SELECT COUNT(*) FROM work_tasks WHERE assigned_to = ?", (employee_id,))
-        task_count = self.cursor.fetchone()[0]
+        cur = self._cursor()
+        # EXISTS останавливается на первой найденной задаче вместо
+        # подсчета всех строк сотрудника
+        cur.execute("SELECT EXISTS(SELECT 1 FROM work_tasks WHERE assigned_to = ?)", (employee_id,))
+        has_tasks = cur.fetchone()[0]
 
-        if task_count > 0:
+        if has_tasks:
             wx.MessageBox(
                 "Нельзя удалить сотрудника, так как ему назначены задачи. Сначала переназначьте или удалите эти задачи.",
                 "Ошибка",
@@ -1437,9 +1868,16 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
-            self.conn.commit()
-            self.load_employees()
+            # Одна явная транзакция, как в on_delete_work_task
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
+                self._employees_cache = None
+                self.load_employees(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     # Обработчики событий для проектов
     def on_add_project(self, event):
@@ -1448,13 +1886,16 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             project_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur = self._cursor()
+            cur.execute(
                 '''INSERT INTO projects 
                 (name, description, start_date, end_date, status, manager)
                 VALUES (?, ?, ?, ?, ?, ?)''',
                 project_data
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._projects_cache = None
+            self._add_filter_value(self._projects, project_data[0], 'work_project_filter')
             self.load_projects()
 
         dlg.Destroy()
@@ -1467,8 +1908,9 @@ class TaskManagerApp(wx.Frame):
             return
 
         project_id = int(self.projects_list.GetItemText(selected))
-        self.cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
-        project_data = self.cursor.fetchone()
+        cur = self._cursor()
+        cur.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
+        project_data = cur.fetchone()
 
         dlg = ProjectDialog(self, title="Редактировать проект")
         dlg.set_data(project_data)
@@ -1476,13 +1918,15 @@ class TaskManagerApp(wx.Frame):
         if dlg.ShowModal() == wx.ID_OK:
             updated_data = dlg.get_data()
 
-            self.cursor.execute(
+            cur.execute(
                 '''UPDATE projects 
                 SET name = ?, description = ?, start_date = ?, end_date = ?, status = ?, manager = ?
                 WHERE id = ?''',
                 (*updated_data, project_id)
             )
-            self.conn.commit()
+            cur.connection.commit()
+            self._projects_cache = None
+            self._add_filter_value(self._projects, updated_data[0], 'work_project_filter')
             self.load_projects()
 
         dlg.Destroy()
@@ -1497,10 +1941,12 @@ class TaskManagerApp(wx.Frame):
         project_id = int(self.projects_list.GetItemText(selected))
 
         # Проверить, есть ли задачи, связанные с этим проектом
-        self.cursor.execute("SELECT COUNT(*) FROM work_tasks WHERE project = ?", (project_id,))
-        task_count = self.cursor.fetchone()[0]
+        cur = self._cursor()
+        # EXISTS вместо COUNT(*), как в on_delete_employee
+        cur.execute("SELECT EXISTS(SELECT 1 FROM work_tasks WHERE project = ?)", (project_id,))
+        has_tasks = cur.fetchone()[0]
 
-        if task_count > 0:
+        if has_tasks:
             wx.MessageBox(
                 "Нельзя удалить проект, так как с ним связаны задачи. Сначала удалите или переназначьте эти задачи.",
                 "Ошибка",
@@ -1515,9 +1961,17 @@ class TaskManagerApp(wx.Frame):
         )
 
         if confirm == wx.YES:
-            self.cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-            self.conn.commit()
-            self.load_projects()
+            # Одна явная транзакция, как в on_delete_work_task
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                cur.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+                self._projects_cache = None
+                self._reload_filter_values('_projects', 'name', 'projects', 'work_project_filter')
+                self.load_projects(cur=cur)
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
 
     def on_view_project_tasks(self, event):
         """Просмотр задач проекта"""
@@ -1527,35 +1981,36 @@ class TaskManagerApp(wx.Frame):
             return
 
         project_id = int(self.projects_list.GetItemText(selected))
-        self.cursor.execute("SELECT name FROM projects WHERE id = ?", (project_id,))
-        project_name = self.cursor.fetchone()[0]
-
-        self.cursor.execute(
-            "SELECT * FROM work_tasks WHERE project = ? ORDER BY deadline",
+        # Имя проекта берется из кэша пар (id, name) — без лишнего
+        # запроса к БД на каждый клик
+        project_name = dict(self.get_projects_cached()).get(project_id, "")
+        cur = self._cursor()
+
+        # Имя исполнителя забирается тем же LEFT JOIN, что и в
+        # load_work_tasks — один запрос вместо SELECT на каждую задачу
+        cur.execute(
+            '''SELECT wt.id, wt.title, wt.status, wt.deadline, e.name
+               FROM work_tasks wt
+               LEFT JOIN employees e ON e.id = wt.assigned_to
+               WHERE wt.project = ?
+               ORDER BY wt.deadline''',
             (project_id,)
         )
-        tasks = self.cursor.fetchall()
+        tasks = cur.fetchall()
 
         dlg = wx.Dialog(self, title=f"Задачи проекта: {project_name}")
 
-        task_list = wx.ListCtrl(dlg, style=wx.LC_REPORT | wx.BORDER_SUNKEN | wx.LC_SINGLE_SEL)
-        task_list.InsertColumn(0, "ID", width=40)
-        task_list.InsertColumn(1, "Заголовок", width=200)
-        task_list.InsertColumn(2, "Статус", width=100)
-        task_list.InsertColumn(3, "Срок", width=100)
-        task_list.InsertColumn(4, "Исполнитель", width=150)
-
-        for task in tasks:
-            idx = task_list.InsertItem(task_list.GetItemCount(), str(task[0]))
-            task_list.SetItem(idx, 1, task[1])
-            task_list.SetItem(idx, 2, task[4])
-            task_list.SetItem(idx, 3, task[5] if task[5] else "")
-
-            if task[8]:  # assigned_to
-                self.cursor.execute("SELECT name FROM employees WHERE id = ?", (task[8],))
-                emp_name = self.cursor.fetchone()
-                if emp_name:
-                    task_list.SetItem(idx, 4, emp_name[0])
+        # Виртуальный список, как на основных вкладках: ноль wx-вызовов
+        # на строку, отрисовка только видимой части
+        task_list = VirtualListCtrl(dlg)
+        _setup_columns(task_list, _PROJECT_TASK_COLS)
+
+        task_list.set_rows([
+            (str(task[0]), task[1], task[2],
+             task[3] if task[3] else "",
+             task[4] if task[4] else "")
+            for task in tasks
+        ])
 
         btn_close = wx.Button(dlg, wx.ID_CLOSE)
         btn_close.Bind(wx.EVT_BUTTON, lambda e: dlg.EndModal(wx.ID_CLOSE))
@@ -1599,12 +2054,27 @@ class TaskManagerApp(wx.Frame):
     def on_close(self, event):
         """Обработка закрытия окна"""
         self.reminder_active = False
+        self._wake_reminder_thread()
+
+        # Ожидание потока напоминаний и закрытие соединения уходят в
+        # отдельный поток: окно исчезает сразу, а checkpoint WAL не
+        # подвешивает GUI при большом журнале
+        conn = getattr(self._tls, 'conn', None)
+        threading.Thread(
+            target=self._shutdown_db, args=(conn,), daemon=False
+        ).start()
+        self.Destroy()
+
+    def _shutdown_db(self, conn):
+        """Фоновое завершение: дождаться поток напоминаний и закрыть БД"""
         if self.reminder_thread.is_alive():
             self.reminder_thread.join(timeout=1)
-
-        self.timer.Stop()
-        self.conn.close()
-        self.Destroy()
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            conn.close()
 
     def update_status_bar(self):
         """Обновление строки состояния"""
@@ -1619,52 +2089,82 @@ class WorkTaskDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Заголовок:", pos=(10, 10))
-        self.title = wx.TextCtrl(self, pos=(120, 10), size=(350, -1))
-
-        wx.StaticText(self, label="Описание:", pos=(10, 40))
-        self.description = wx.TextCtrl(self, pos=(120, 40), size=(350, 100), style=wx.TE_MULTILINE)
-
-        wx.StaticText(self, label="Приоритет:", pos=(10, 150))
-        self.priority = wx.SpinCtrl(self, pos=(120, 150), size=(50, -1), min=1, max=5)
+        # Форма собирается сайзерами: один проход компоновки вместо
+        # немедленного пересчета координат после каждого виджета
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
 
-        wx.StaticText(self, label="Статус:", pos=(10, 180))
-        self.status = wx.ComboBox(self, pos=(120, 180), size=(150, -1),
-                                  choices=["В ожидании", "В работе", "Завершено"])
-
-        wx.StaticText(self, label="Срок:", pos=(10, 210))
-        self.deadline = wx.adv.DatePickerCtrl(self, pos=(120, 210), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
-        self.time = wx.SpinCtrl(self, pos=(280, 210), size=(50, -1), min=0, max=23)
-        wx.StaticText(self, label=":", pos=(335, 210))
-        self.minutes = wx.SpinCtrl(self, pos=(345, 210), size=(50, -1), min=0, max=59)
-
-        wx.StaticText(self, label="Проект:", pos=(10, 240))
-        self.project = wx.ComboBox(self, pos=(120, 240), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Заголовок:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.title = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.title, 1, wx.EXPAND)
 
-        # Заполнение списка проектов
-        self.parent.cursor.execute("SELECT id, name FROM projects")
-        projects = self.parent.cursor.fetchall()
-        self.project.Append("", None)  # Пустой элемент
-        for proj_id, proj_name in projects:
-            self.project.Append(proj_name, proj_id)
+        grid.Add(wx.StaticText(self, label="Описание:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.description = wx.TextCtrl(self, size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.description, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Исполнитель:", pos=(10, 270))
-        self.assigned_to = wx.ComboBox(self, pos=(120, 270), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Приоритет:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.priority = wx.SpinCtrl(self, size=(50, -1), min=1, max=5)
+        grid.Add(self.priority)
 
-        # Заполнение списка сотрудников
-        self.parent.cursor.execute("SELECT id, name FROM employees")
-        employees = self.parent.cursor.fetchall()
-        self.assigned_to.Append("", None)  # Пустой элемент
-        for emp_id, emp_name in employees:
-            self.assigned_to.Append(emp_name, emp_id)
-
-        wx.StaticText(self, label="Категория:", pos=(10, 300))
-        self.category = wx.TextCtrl(self, pos=(120, 300), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Статус:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.status = wx.ComboBox(self, size=(150, -1),
+                                  choices=["В ожидании", "В работе", "Завершено"])
+        grid.Add(self.status)
+
+        grid.Add(wx.StaticText(self, label="Срок:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.deadline = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        self.time = wx.SpinCtrl(self, size=(50, -1), min=0, max=23)
+        self.minutes = wx.SpinCtrl(self, size=(50, -1), min=0, max=59)
+        deadline_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        deadline_sizer.Add(self.deadline, 0, wx.RIGHT, 6)
+        deadline_sizer.Add(self.time)
+        deadline_sizer.Add(wx.StaticText(self, label=":"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT, 2)
+        deadline_sizer.Add(self.minutes)
+        grid.Add(deadline_sizer)
+
+        grid.Add(wx.StaticText(self, label="Проект:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.project = wx.ComboBox(self, size=(150, -1))
+        grid.Add(self.project)
+
+        # Заполнение списка проектов из кэша родителя — диалог
+        # открывается без обращений к БД. Set() вставляет все имена
+        # одним вызовом wx вместо Append на каждую строку
+        projects = self.parent.get_projects_cached()
+        self.project.Set([""] + [name for _, name in projects])
+        self.project.SetClientData(0, None)  # Пустой элемент
+        # Индекс id -> позиция для O(1) выбора в set_data
+        self._project_idx = {}
+        for i, (proj_id, _) in enumerate(projects, start=1):
+            self.project.SetClientData(i, proj_id)
+            self._project_idx[proj_id] = i
+
+        grid.Add(wx.StaticText(self, label="Исполнитель:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.assigned_to = wx.ComboBox(self, size=(150, -1))
+        grid.Add(self.assigned_to)
+
+        # Заполнение списка сотрудников из кэша родителя, одним Set()
+        employees = self.parent.get_employees_cached()
+        self.assigned_to.Set([""] + [name for _, name in employees])
+        self.assigned_to.SetClientData(0, None)  # Пустой элемент
+        # Индекс id -> позиция, как для проектов
+        self._emp_idx = {}
+        for i, (emp_id, _) in enumerate(employees, start=1):
+            self.assigned_to.SetClientData(i, emp_id)
+            self._emp_idx[emp_id] = i
+
+        grid.Add(wx.StaticText(self, label="Категория:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.category = wx.TextCtrl(self, size=(150, -1))
+        grid.Add(self.category)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(300, 330))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(400, 330))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def set_data(self, data):
         """Заполнение формы данными"""
@@ -1674,24 +2174,21 @@ class WorkTaskDialog(wx.Dialog):
         self.status.SetValue(data[4])
 
         if data[5]:
-            deadline = datetime.strptime(data[5], "%Y-%m-%d %H:%M:%S")
-            self.deadline.SetValue(wx.DateTime.FromDMY(
-                deadline.day, deadline.month - 1, deadline.year
-            ))
-            self.time.SetValue(deadline.hour)
-            self.minutes.SetValue(deadline.minute)
+            year, month, day, hour, minute = _parse_sql_dt(data[5])
+            self.deadline.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
+            self.time.SetValue(hour)
+            self.minutes.SetValue(minute)
 
         if data[7]:  # project
-            for i in range(self.project.GetCount()):
-                if self.project.GetClientData(i) == data[7]:
-                    self.project.SetSelection(i)
-                    break
+            # Поиск по словарю вместо линейного обхода GetClientData
+            idx = self._project_idx.get(data[7])
+            if idx is not None:
+                self.project.SetSelection(idx)
 
         if data[8]:  # assigned_to
-            for i in range(self.assigned_to.GetCount()):
-                if self.assigned_to.GetClientData(i) == data[8]:
-                    self.assigned_to.SetSelection(i)
-                    break
+            idx = self._emp_idx.get(data[8])
+            if idx is not None:
+                self.assigned_to.SetSelection(idx)
 
         self.category.SetValue(data[9] if data[9] else "")
 
@@ -1707,7 +2204,7 @@ class WorkTaskDialog(wx.Dialog):
         minute = self.minutes.GetValue()
 
         if date.IsValid():
-            deadline = f"{date.GetYear()}-{date.GetMonth() + 1:02d}-{date.GetDay():02d} {hour:02d}:{minute:02d}:00"
+            deadline = _fmt_deadline(date, hour, minute)
         else:
             deadline = None
 
@@ -1733,38 +2230,59 @@ class StudyTaskDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Заголовок:", pos=(10, 10))
-        self.title = wx.TextCtrl(self, pos=(120, 10), size=(350, -1))
-
-        wx.StaticText(self, label="Описание:", pos=(10, 40))
-        self.description = wx.TextCtrl(self, pos=(120, 40), size=(350, 100), style=wx.TE_MULTILINE)
+        # Компоновка сайзерами, как в WorkTaskDialog
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
 
-        wx.StaticText(self, label="Приоритет:", pos=(10, 150))
-        self.priority = wx.SpinCtrl(self, pos=(120, 150), size=(50, -1), min=1, max=5)
+        grid.Add(wx.StaticText(self, label="Заголовок:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.title = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.title, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Статус:", pos=(10, 180))
-        self.status = wx.ComboBox(self, pos=(120, 180), size=(150, -1),
-                                  choices=["В ожидании", "В работе", "Завершено"])
+        grid.Add(wx.StaticText(self, label="Описание:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.description = wx.TextCtrl(self, size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.description, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Срок:", pos=(10, 210))
-        self.deadline = wx.adv.DatePickerCtrl(self, pos=(120, 210), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
-        self.time = wx.SpinCtrl(self, pos=(280, 210), size=(50, -1), min=0, max=23)
-        wx.StaticText(self, label=":", pos=(335, 210))
-        self.minutes = wx.SpinCtrl(self, pos=(345, 210), size=(50, -1), min=0, max=59)
+        grid.Add(wx.StaticText(self, label="Приоритет:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.priority = wx.SpinCtrl(self, size=(50, -1), min=1, max=5)
+        grid.Add(self.priority)
 
-        wx.StaticText(self, label="Курс:", pos=(10, 240))
-        self.course = wx.TextCtrl(self, pos=(120, 240), size=(350, -1))
-
-        wx.StaticText(self, label="Тема:", pos=(10, 270))
-        self.topic = wx.TextCtrl(self, pos=(120, 270), size=(350, -1))
-
-        wx.StaticText(self, label="URL ресурса:", pos=(10, 300))
-        self.resource_url = wx.TextCtrl(self, pos=(120, 300), size=(350, -1))
+        grid.Add(wx.StaticText(self, label="Статус:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.status = wx.ComboBox(self, size=(150, -1),
+                                  choices=["В ожидании", "В работе", "Завершено"])
+        grid.Add(self.status)
+
+        grid.Add(wx.StaticText(self, label="Срок:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.deadline = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        self.time = wx.SpinCtrl(self, size=(50, -1), min=0, max=23)
+        self.minutes = wx.SpinCtrl(self, size=(50, -1), min=0, max=59)
+        deadline_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        deadline_sizer.Add(self.deadline, 0, wx.RIGHT, 6)
+        deadline_sizer.Add(self.time)
+        deadline_sizer.Add(wx.StaticText(self, label=":"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT, 2)
+        deadline_sizer.Add(self.minutes)
+        grid.Add(deadline_sizer)
+
+        grid.Add(wx.StaticText(self, label="Курс:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.course = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.course, 1, wx.EXPAND)
+
+        grid.Add(wx.StaticText(self, label="Тема:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.topic = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.topic, 1, wx.EXPAND)
+
+        grid.Add(wx.StaticText(self, label="URL ресурса:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.resource_url = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.resource_url, 1, wx.EXPAND)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(300, 330))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(400, 330))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def set_data(self, data):
         """Заполнение формы данными"""
@@ -1774,12 +2292,10 @@ class StudyTaskDialog(wx.Dialog):
         self.status.SetValue(data[4])
 
         if data[5]:
-            deadline = datetime.strptime(data[5], "%Y-%m-%d %H:%M:%S")
-            self.deadline.SetValue(wx.DateTime.FromDMY(
-                deadline.day, deadline.month - 1, deadline.year
-            ))
-            self.time.SetValue(deadline.hour)
-            self.minutes.SetValue(deadline.minute)
+            year, month, day, hour, minute = _parse_sql_dt(data[5])
+            self.deadline.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
+            self.time.SetValue(hour)
+            self.minutes.SetValue(minute)
 
         self.course.SetValue(data[7] if data[7] else "")
         self.topic.SetValue(data[8] if data[8] else "")
@@ -1797,7 +2313,7 @@ class StudyTaskDialog(wx.Dialog):
         minute = self.minutes.GetValue()
 
         if date.IsValid():
-            deadline = f"{date.GetYear()}-{date.GetMonth() + 1:02d}-{date.GetDay():02d} {hour:02d}:{minute:02d}:00"
+            deadline = _fmt_deadline(date, hour, minute)
         else:
             deadline = None
 
@@ -1817,38 +2333,59 @@ class GoalDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Цель:", pos=(10, 10))
-        self.title = wx.TextCtrl(self, pos=(120, 10), size=(350, -1))
-
-        wx.StaticText(self, label="Описание:", pos=(10, 40))
-        self.description = wx.TextCtrl(self, pos=(120, 40), size=(350, 100), style=wx.TE_MULTILINE)
-
-        wx.StaticText(self, label="Приоритет:", pos=(10, 150))
-        self.priority = wx.SpinCtrl(self, pos=(120, 150), size=(50, -1), min=1, max=5)
-
-        wx.StaticText(self, label="Статус:", pos=(10, 180))
-        self.status = wx.ComboBox(self, pos=(120, 180), size=(150, -1),
-                                  choices=["В ожидании", "В процессе", "Достигнуто"])
+        # Компоновка сайзерами, как в WorkTaskDialog
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
 
-        wx.StaticText(self, label="Срок:", pos=(10, 210))
-        self.deadline = wx.adv.DatePickerCtrl(self, pos=(120, 210), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
-        self.time = wx.SpinCtrl(self, pos=(280, 210), size=(50, -1), min=0, max=23)
-        wx.StaticText(self, label=":", pos=(335, 210))
-        self.minutes = wx.SpinCtrl(self, pos=(345, 210), size=(50, -1), min=0, max=59)
+        grid.Add(wx.StaticText(self, label="Цель:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.title = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.title, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Категория:", pos=(10, 240))
-        self.category = wx.TextCtrl(self, pos=(120, 240), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Описание:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.description = wx.TextCtrl(self, size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.description, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Целевое значение:", pos=(10, 270))
-        self.target_value = wx.TextCtrl(self, pos=(120, 270), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Приоритет:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.priority = wx.SpinCtrl(self, size=(50, -1), min=1, max=5)
+        grid.Add(self.priority)
 
-        wx.StaticText(self, label="Текущее значение:", pos=(10, 300))
-        self.current_value = wx.TextCtrl(self, pos=(120, 300), size=(150, -1))
+        grid.Add(wx.StaticText(self, label="Статус:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.status = wx.ComboBox(self, size=(150, -1),
+                                  choices=["В ожидании", "В процессе", "Достигнуто"])
+        grid.Add(self.status)
+
+        grid.Add(wx.StaticText(self, label="Срок:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.deadline = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        self.time = wx.SpinCtrl(self, size=(50, -1), min=0, max=23)
+        self.minutes = wx.SpinCtrl(self, size=(50, -1), min=0, max=59)
+        deadline_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        deadline_sizer.Add(self.deadline, 0, wx.RIGHT, 6)
+        deadline_sizer.Add(self.time)
+        deadline_sizer.Add(wx.StaticText(self, label=":"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT, 2)
+        deadline_sizer.Add(self.minutes)
+        grid.Add(deadline_sizer)
+
+        grid.Add(wx.StaticText(self, label="Категория:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.category = wx.TextCtrl(self, size=(150, -1))
+        grid.Add(self.category)
+
+        grid.Add(wx.StaticText(self, label="Целевое значение:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.target_value = wx.SpinCtrlDouble(self, size=(150, -1), min=0, max=1e9, inc=1)
+        grid.Add(self.target_value)
+
+        grid.Add(wx.StaticText(self, label="Текущее значение:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.current_value = wx.SpinCtrlDouble(self, size=(150, -1), min=0, max=1e9, inc=1)
+        grid.Add(self.current_value)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(300, 380))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(400, 380))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def set_data(self, data):
         """Заполнение формы данными"""
@@ -1858,16 +2395,14 @@ class GoalDialog(wx.Dialog):
         self.status.SetValue(data[4])
 
         if data[5]:
-            deadline = datetime.strptime(data[5], "%Y-%m-%d %H:%M:%S")
-            self.deadline.SetValue(wx.DateTime.FromDMY(
-                deadline.day, deadline.month - 1, deadline.year
-            ))
-            self.time.SetValue(deadline.hour)
-            self.minutes.SetValue(deadline.minute)
+            year, month, day, hour, minute = _parse_sql_dt(data[5])
+            self.deadline.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
+            self.time.SetValue(hour)
+            self.minutes.SetValue(minute)
 
         self.category.SetValue(data[7] if data[7] else "")
-        self.target_value.SetValue(str(data[8]) if data[8] is not None else "")
-        self.current_value.SetValue(str(data[9]) if data[9] is not None else "")
+        self.target_value.SetValue(data[8] if data[8] is not None else 0)
+        self.current_value.SetValue(data[9] if data[9] is not None else 0)
 
     def get_data(self):
         """Получение данных из формы"""
@@ -1881,21 +2416,16 @@ class GoalDialog(wx.Dialog):
         minute = self.minutes.GetValue()
 
         if date.IsValid():
-            deadline = f"{date.GetYear()}-{date.GetMonth() + 1:02d}-{date.GetDay():02d} {hour:02d}:{minute:02d}:00"
+            deadline = _fmt_deadline(date, hour, minute)
         else:
             deadline = None
 
         category = self.category.GetValue()
 
-        try:
-            target = float(self.target_value.GetValue()) if self.target_value.GetValue() else None
-        except ValueError:
-            target = None
-
-        try:
-            current = float(self.current_value.GetValue()) if self.current_value.GetValue() else 0
-        except ValueError:
-            current = 0
+        # SpinCtrlDouble отдает число напрямую — без str/float
+        # round-trip и try/except; нулевая цель означает "не задана"
+        target = self.target_value.GetValue() or None
+        current = self.current_value.GetValue()
 
         return (
             title, description, priority, status, deadline,
@@ -1909,31 +2439,50 @@ class ReminderDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Сообщение:", pos=(10, 10))
-        self.message = wx.TextCtrl(self, pos=(120, 10), size=(350, 100), style=wx.TE_MULTILINE)
-
-        wx.StaticText(self, label="Время напоминания:", pos=(10, 120))
-        self.date = wx.adv.DatePickerCtrl(self, pos=(120, 120), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
-        self.time = wx.SpinCtrl(self, pos=(280, 120), size=(50, -1), min=0, max=23)
-        wx.StaticText(self, label=":", pos=(335, 120))
-        self.minutes = wx.SpinCtrl(self, pos=(345, 120), size=(50, -1), min=0, max=59)
-
-        self.recurring = wx.CheckBox(self, label="Повторяющееся напоминание", pos=(10, 150))
+        # Компоновка сайзерами, как в WorkTaskDialog
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
+
+        grid.Add(wx.StaticText(self, label="Сообщение:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.message = wx.TextCtrl(self, size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.message, 1, wx.EXPAND)
+
+        grid.Add(wx.StaticText(self, label="Время напоминания:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.date = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        self.time = wx.SpinCtrl(self, size=(50, -1), min=0, max=23)
+        self.minutes = wx.SpinCtrl(self, size=(50, -1), min=0, max=59)
+        time_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        time_sizer.Add(self.date, 0, wx.RIGHT, 6)
+        time_sizer.Add(self.time)
+        time_sizer.Add(wx.StaticText(self, label=":"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT, 2)
+        time_sizer.Add(self.minutes)
+        grid.Add(time_sizer)
+
+        self.recurring = wx.CheckBox(self, label="Повторяющееся напоминание")
         self.recurring.Bind(wx.EVT_CHECKBOX, self.on_recurring_check)
+        grid.Add(self.recurring)
+        grid.AddSpacer(0)
 
-        wx.StaticText(self, label="Интервал:", pos=(10, 180))
-        self.interval = wx.SpinCtrl(self, pos=(120, 180), size=(50, -1), min=1, max=365)
+        grid.Add(wx.StaticText(self, label="Интервал:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.interval = wx.SpinCtrl(self, size=(50, -1), min=1, max=365)
         self.interval.Disable()
+        grid.Add(self.interval)
 
-        wx.StaticText(self, label="Период:", pos=(10, 210))
-        self.unit = wx.ComboBox(self, pos=(120, 210), size=(150, -1),
-                                choices=["минуты", "часы", "дни", "недели", "месяцы"])
+        grid.Add(wx.StaticText(self, label="Период:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.unit = wx.ComboBox(self, size=(150, -1),
+                                choices=list(_UNIT_RU.values()))
         self.unit.Disable()
+        grid.Add(self.unit)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(300, 280))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(400, 280))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def on_recurring_check(self, event):
         """Активация/деактивация элементов повторения"""
@@ -1949,23 +2498,15 @@ class ReminderDialog(wx.Dialog):
         self.message.SetValue(data[1])
 
         if data[2]:
-            remind_time = datetime.strptime(data[2], "%Y-%m-%d %H:%M:%S")
-            self.date.SetValue(wx.DateTime.FromDMY(
-                remind_time.day, remind_time.month - 1, remind_time.year
-            ))
-            self.time.SetValue(remind_time.hour)
-            self.minutes.SetValue(remind_time.minute)
+            year, month, day, hour, minute = _parse_sql_dt(data[2])
+            self.date.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
+            self.time.SetValue(hour)
+            self.minutes.SetValue(minute)
 
         if data[3]:  # is_recurring
             self.recurring.SetValue(True)
             self.interval.SetValue(data[4])
-            self.unit.SetValue({
-                                   "minutes": "минуты",
-                                   "hours": "часы",
-                                   "days": "дни",
-                                   "weeks": "недели",
-                                   "months": "месяцы"
-                               }.get(data[5], "дни"))
+            self.unit.SetValue(_UNIT_RU.get(data[5], "дни"))
 
             self.interval.Enable()
             self.unit.Enable()
@@ -1979,7 +2520,7 @@ class ReminderDialog(wx.Dialog):
         minute = self.minutes.GetValue()
 
         if date.IsValid():
-            remind_time = f"{date.GetYear()}-{date.GetMonth() + 1:02d}-{date.GetDay():02d} {hour:02d}:{minute:02d}:00"
+            remind_time = _fmt_deadline(date, hour, minute)
         else:
             remind_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -1987,14 +2528,7 @@ class ReminderDialog(wx.Dialog):
         interval = self.interval.GetValue() if is_recurring else None
 
         if is_recurring:
-            unit_map = {
-                "минуты": "minutes",
-                "часы": "hours",
-                "дни": "days",
-                "недели": "weeks",
-                "месяцы": "months"
-            }
-            unit = unit_map.get(self.unit.GetValue(), "days")
+            unit = _UNIT_EN.get(self.unit.GetValue(), "days")
         else:
             unit = None
 
@@ -2007,25 +2541,39 @@ class EmployeeDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Имя:", pos=(10, 10))
-        self.name = wx.TextCtrl(self, pos=(120, 10), size=(250, -1))
+        # Компоновка сайзерами, как в WorkTaskDialog
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
 
-        wx.StaticText(self, label="Должность:", pos=(10, 40))
-        self.position = wx.TextCtrl(self, pos=(120, 40), size=(250, -1))
+        grid.Add(wx.StaticText(self, label="Имя:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.name = wx.TextCtrl(self, size=(250, -1))
+        grid.Add(self.name, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Email:", pos=(10, 70))
-        self.email = wx.TextCtrl(self, pos=(120, 70), size=(250, -1))
+        grid.Add(wx.StaticText(self, label="Должность:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.position = wx.TextCtrl(self, size=(250, -1))
+        grid.Add(self.position, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Телефон:", pos=(10, 100))
-        self.phone = wx.TextCtrl(self, pos=(120, 100), size=(250, -1))
+        grid.Add(wx.StaticText(self, label="Email:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.email = wx.TextCtrl(self, size=(250, -1))
+        grid.Add(self.email, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Заметки:", pos=(10, 130))
-        self.notes = wx.TextCtrl(self, pos=(120, 130), size=(250, 100), style=wx.TE_MULTILINE)
+        grid.Add(wx.StaticText(self, label="Телефон:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.phone = wx.TextCtrl(self, size=(250, -1))
+        grid.Add(self.phone, 1, wx.EXPAND)
+
+        grid.Add(wx.StaticText(self, label="Заметки:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.notes = wx.TextCtrl(self, size=(250, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.notes, 1, wx.EXPAND)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(200, 240))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(300, 240))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def set_data(self, data):
         """Заполнение формы данными"""
@@ -2052,29 +2600,44 @@ class ProjectDialog(wx.Dialog):
 
         self.parent = parent
 
-        # Элементы формы
-        wx.StaticText(self, label="Название:", pos=(10, 10))
-        self.name = wx.TextCtrl(self, pos=(120, 10), size=(350, -1))
+        # Компоновка сайзерами, как в WorkTaskDialog
+        grid = wx.FlexGridSizer(cols=2, vgap=4, hgap=6)
+        grid.AddGrowableCol(1)
+
+        grid.Add(wx.StaticText(self, label="Название:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.name = wx.TextCtrl(self, size=(350, -1))
+        grid.Add(self.name, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Описание:", pos=(10, 40))
-        self.description = wx.TextCtrl(self, pos=(120, 40), size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(wx.StaticText(self, label="Описание:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.description = wx.TextCtrl(self, size=(350, 100), style=wx.TE_MULTILINE)
+        grid.Add(self.description, 1, wx.EXPAND)
 
-        wx.StaticText(self, label="Дата начала:", pos=(10, 150))
-        self.start_date = wx.adv.DatePickerCtrl(self, pos=(120, 150), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        grid.Add(wx.StaticText(self, label="Дата начала:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.start_date = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        grid.Add(self.start_date)
 
-        wx.StaticText(self, label="Дата завершения:", pos=(10, 180))
-        self.end_date = wx.adv.DatePickerCtrl(self, pos=(120, 180), style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        grid.Add(wx.StaticText(self, label="Дата завершения:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.end_date = wx.adv.DatePickerCtrl(self, style=wx.adv.DP_DROPDOWN | wx.adv.DP_SHOWCENTURY)
+        grid.Add(self.end_date)
 
-        wx.StaticText(self, label="Статус:", pos=(10, 210))
-        self.status = wx.ComboBox(self, pos=(120, 210), size=(150, -1),
+        grid.Add(wx.StaticText(self, label="Статус:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.status = wx.ComboBox(self, size=(150, -1),
                                   choices=["Планирование", "В работе", "Приостановлен", "Завершен"])
+        grid.Add(self.status)
 
-        wx.StaticText(self, label="Руководитель:", pos=(10, 240))
-        self.manager = wx.TextCtrl(self, pos=(120, 240), size=(250, -1))
+        grid.Add(wx.StaticText(self, label="Руководитель:"), 0, wx.ALIGN_CENTER_VERTICAL)
+        self.manager = wx.TextCtrl(self, size=(250, -1))
+        grid.Add(self.manager, 1, wx.EXPAND)
 
         # Кнопки
-        btn_ok = wx.Button(self, wx.ID_OK, label="OK", pos=(300, 280))
-        btn_cancel = wx.Button(self, wx.ID_CANCEL, label="Отмена", pos=(400, 280))
+        btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        btn_sizer.Add(wx.Button(self, wx.ID_OK, label="OK"), 0, wx.RIGHT, 6)
+        btn_sizer.Add(wx.Button(self, wx.ID_CANCEL, label="Отмена"))
+
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+        main_sizer.Add(grid, 1, wx.EXPAND | wx.ALL, 10)
+        main_sizer.Add(btn_sizer, 0, wx.ALIGN_RIGHT | wx.ALL, 10)
+        self.SetSizerAndFit(main_sizer)
 
     def set_data(self, data):
         """Заполнение формы данными"""
@@ -2082,16 +2645,12 @@ class ProjectDialog(wx.Dialog):
         self.description.SetValue(data[2] if data[2] else "")
 
         if data[3]:  # start_date
-            start_date = datetime.strptime(data[3], "%Y-%m-%d %H:%M:%S")
-            self.start_date.SetValue(wx.DateTime.FromDMY(
-                start_date.day, start_date.month - 1, start_date.year
-            ))
+            year, month, day, _, _ = _parse_sql_dt(data[3])
+            self.start_date.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
 
         if data[4]:  # end_date
-            end_date = datetime.strptime(data[4], "%Y-%m-%d %H:%M:%S")
-            self.end_date.SetValue(wx.DateTime.FromDMY(
-                end_date.day, end_date.month - 1, end_date.year
-            ))
+            year, month, day, _, _ = _parse_sql_dt(data[4])
+            self.end_date.SetValue(wx.DateTime.FromDMY(day, month - 1, year))
 
         self.status.SetValue(data[5] if data[5] else "Планирование")
         self.manager.SetValue(data[6] if data[6] else "")
@@ -2103,13 +2662,13 @@ class ProjectDialog(wx.Dialog):
 
         start_date_val = self.start_date.GetValue()
         if start_date_val.IsValid():
-            start_date = f"{start_date_val.GetYear()}-{start_date_val.GetMonth() + 1:02d}-{start_date_val.GetDay():02d} 00:00:00"
+            start_date = _fmt_deadline(start_date_val)
         else:
             start_date = None
 
         end_date_val = self.end_date.GetValue()
         if end_date_val.IsValid():
-            end_date = f"{end_date_val.GetYear()}-{end_date_val.GetMonth() + 1:02d}-{end_date_val.GetDay():02d} 00:00:00"
+            end_date = _fmt_deadline(end_date_val)
         else:
             end_date = None
 